@@ -0,0 +1,32 @@
+"""add_coupon_lookup_index
+
+Revision ID: add_coupon_lookup_index
+Revises: add_maps_link
+Create Date: 2025-11-20 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_coupon_lookup_index'
+down_revision: Union[str, None] = 'add_maps_link'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering index for coupon validation (code + active + expiry filter)
+    op.create_index(
+        'idx_coupons_code_active_exp',
+        'coupons',
+        ['coupon_code', 'is_active', 'expiration_time']
+    )
+
+
+def downgrade() -> None:
+    # Remove coupon validation index
+    op.drop_index('idx_coupons_code_active_exp', table_name='coupons')
@@ -61,10 +61,15 @@ class Settings(BaseSettings):
     SES_REGION: str = os.getenv("SES_REGION", "us-east-1")
     SES_FROM_EMAIL: str = os.getenv("SES_FROM_EMAIL", "no-reply@gogocar.in")
     SES_FROM_NAME: str = os.getenv("SES_FROM_NAME", "GoGoCar")
+    # Send booking emails via the stored SES template (see app/scripts/create_ses_templates.py)
+    SES_USE_TEMPLATES: bool = False
     
     # Pagination
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
+    PAGINATION_SKIP_TOTAL: bool = False  # Skip COUNT(*) and derive has_next from one extra row
+    PAGINATION_COUNT_CACHE_TTL: int = 60  # Seconds to reuse a COUNT result (0 disables)
+    PAGINATION_COUNT_CACHE_MIN_ROWS: int = 1000  # Only cache counts at least this large
     
     model_config = {
         "env_file": ".env",
@@ -6,8 +6,9 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from sqlalchemy import (
     Column, Integer, String, Boolean, Text, JSON, Float, DateTime,
-    ForeignKey, Enum
+    ForeignKey, Enum, Index, and_
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.session import Base
@@ -119,6 +120,25 @@ class UserProfile(Base):
     # Relationships
     approved_by_user = relationship("UserProfile", remote_side=[id])
 
+    @hybrid_property
+    def kyc_complete(self) -> bool:
+        """True when all four KYC documents have been uploaded"""
+        return all((
+            self.aadhaar_front, self.aadhaar_back,
+            self.drivinglicense_front, self.drivinglicense_back
+        ))
+
+    @kyc_complete.expression
+    def kyc_complete(cls):
+        # Same rule as the Python side: NULL and '' both count as missing
+        return and_(*(
+            and_(column.isnot(None), column != '')
+            for column in (
+                cls.aadhaar_front, cls.aadhaar_back,
+                cls.drivinglicense_front, cls.drivinglicense_back
+            )
+        ))
+
 
 class Location(Base):
     """Location model for car pickup/drop locations"""
@@ -216,6 +236,9 @@ class AnonymousUsers(Base):
 class Coupons(Base):
     """Coupons/Offers model for discounts"""
     __tablename__ = 'coupons'
+    __table_args__ = (
+        Index('idx_coupons_code_active_exp', 'coupon_code', 'is_active', 'expiration_time'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     coupon_code = Column(String, unique=True, nullable=False, index=True)
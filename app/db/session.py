@@ -39,14 +39,9 @@ SessionLocal = sessionmaker(
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
-    """
-    Dependency for getting database session
-    
-    Yields:
-        Database session
-    """
-    db = SessionLocal()
+def _session_scope(**session_kwargs) -> Generator[Session, None, None]:
+    """Yield a session that commits on success and rolls back on error"""
+    db = SessionLocal(**session_kwargs)
     try:
         yield db
         db.commit()
@@ -64,6 +59,30 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_db() -> Generator[Session, None, None]:
+    """
+    Dependency for getting database session
+    
+    Yields:
+        Database session
+    """
+    yield from _session_scope()
+
+
+def get_db_no_expire() -> Generator[Session, None, None]:
+    """
+    Dependency for a session that keeps instances loaded after commit
+    
+    For write endpoints that return the row they just committed, so
+    serializing it does not reload it. Only use it where the model has no
+    server-generated columns besides the primary key.
+    
+    Yields:
+        Database session with expire_on_commit=False
+    """
+    yield from _session_scope(expire_on_commit=False)
+
+
 def init_db() -> None:
     """Initialize database tables"""
     try:
@@ -1,6 +1,7 @@
 """
 Main FastAPI application entry point - Final Reload Triggered
 """
+from contextlib import asynccontextmanager
 from typing import Optional
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,6 +17,7 @@ from app.core.templates import templates
 from app.core.middleware import AuthMiddleware
 from app.db.session import init_db, get_db
 from app.routes import auth, payments, bookings
+from app.services.ccavenue_service import ccavenue_service
 from fastapi import Depends
 from sqlalchemy.orm import Session
 # Include other routes as they are created
@@ -26,13 +28,22 @@ from sqlalchemy.orm import Session
 # We just need to make sure the logger is available here.
 logger.info(f"Starting {settings.APP_NAME} in {'DEBUG' if settings.DEBUG else 'PRODUCTION'} mode")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared clients on shutdown"""
+    yield
+    await ccavenue_service.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     # docs_url=None,
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="GoGoCar - Self Drive Car Rental Application",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -713,6 +724,7 @@ async def payment_page(
     from fastapi.responses import RedirectResponse
     from app.db.models import Cars, UserProfile
     from app.services.payment_calculation import payment_calculation_service
+    from app.schemas.payment import PricingInput
     from app.services.kyc_service import kyc_service
     from datetime import datetime
     
@@ -791,12 +803,15 @@ async def payment_page(
         # Calculate pricing (default protection level 0 - no protection)
         pricing_breakdown = None
         if car:
-            pricing_breakdown = payment_calculation_service.calculate_pricing_breakdown(
+            pricing_input = PricingInput(
                 base_price=float(car.base_price),
                 damage_price=float(car.damage_price),
                 hours=hours,
                 damage_protection=0  # Default to 0 (no protection), can be changed by user
             )
+            pricing_breakdown = payment_calculation_service.calculate_pricing_breakdown(
+                **pricing_input.model_dump()
+            )
         
         # Get car image
         car_image = "/static/img/landing.png"
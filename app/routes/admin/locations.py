@@ -5,7 +5,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import get_db, get_db_no_expire
 from app.schemas.location import LocationCreate, LocationUpdate, LocationResponse
 from app.services.location_service import location_service
 from app.routes.admin.dependencies import require_admin
@@ -65,7 +65,7 @@ async def get_location(
 @router.post("", response_model=LocationResponse, status_code=status.HTTP_201_CREATED)
 async def create_location(
     location_data: LocationCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_no_expire),
     current_user: dict = Depends(require_admin)
 ):
     """Create a new location"""
@@ -83,7 +83,7 @@ async def create_location(
 async def update_location(
     location_id: int,
     location_data: LocationUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_no_expire),
     current_user: dict = Depends(require_admin)
 ):
     """Update a location"""
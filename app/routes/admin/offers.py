@@ -122,7 +122,7 @@ async def create_offer(
     try:
         # Check if coupon code already exists
         existing = db.query(Coupons).filter(
-            Coupons.coupon_code == offer_data.coupon_code.upper().strip()
+            Coupons.coupon_code == offer_data.coupon_code
         ).first()
         
         if existing:
@@ -133,7 +133,7 @@ async def create_offer(
         
         # Create new coupon
         coupon = Coupons(
-            coupon_code=offer_data.coupon_code.upper().strip(),
+            coupon_code=offer_data.coupon_code,
             discount=offer_data.discount,
             discount_type=offer_data.discount_type.upper(),
             is_active=offer_data.is_active,
@@ -184,9 +184,9 @@ async def update_offer(
             )
         
         # Check coupon code uniqueness if being updated
-        if offer_data.coupon_code and offer_data.coupon_code.upper().strip() != coupon.coupon_code:
+        if offer_data.coupon_code and offer_data.coupon_code != coupon.coupon_code:
             existing = db.query(Coupons).filter(
-                Coupons.coupon_code == offer_data.coupon_code.upper().strip(),
+                Coupons.coupon_code == offer_data.coupon_code,
                 Coupons.id != offer_id
             ).first()
             
@@ -200,9 +200,7 @@ async def update_offer(
         update_dict = offer_data.model_dump(exclude_unset=True)
         
         for key, value in update_dict.items():
-            if key == "coupon_code":
-                setattr(coupon, key, value.upper().strip())
-            elif key == "discount_type":
+            if key == "discount_type":
                 setattr(coupon, key, value.upper())
             else:
                 setattr(coupon, key, value)
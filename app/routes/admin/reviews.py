@@ -38,12 +38,14 @@ async def list_reviews(
     Returns:
         Paginated list of reviews
     """
-    query = db.query(Reviews).options(
-        joinedload(Reviews.user),
-        joinedload(Reviews.car)
-    ).order_by(Reviews.created_at.desc())
+    query = db.query(Reviews).order_by(Reviews.created_at.desc())
     
-    reviews, pagination = paginate_query(query, page=page, page_size=page_size)
+    reviews, pagination = paginate_query(
+        query,
+        page=page,
+        page_size=page_size,
+        eager=[joinedload(Reviews.user), joinedload(Reviews.car)]
+    )
     
     # Enrich reviews with user and car details
     enriched_reviews = []
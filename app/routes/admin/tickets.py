@@ -53,9 +53,7 @@ async def list_tickets(
     current_user: dict = Depends(require_admin)
 ):
     """List all tickets with pagination and filters"""
-    query = db.query(SupportTicket).options(
-        joinedload(SupportTicket.user)
-    ).order_by(SupportTicket.created_at.desc())
+    query = db.query(SupportTicket).order_by(SupportTicket.created_at.desc())
     
     # Apply filters
     if status:
@@ -71,7 +69,9 @@ async def list_tickets(
     if priority:
         query = query.filter(SupportTicket.priority == priority.upper())
     
-    tickets, pagination = paginate_query(query, page=page, page_size=page_size)
+    tickets, pagination = paginate_query(
+        query, page=page, page_size=page_size, eager=[joinedload(SupportTicket.user)]
+    )
     
     # Enrich tickets with user details
     enriched_tickets = []
@@ -1,6 +1,8 @@
 """
 Mobile KYC endpoints
   POST /api/mobile/kyc/upload  – upload documents, set status PENDING
+  POST /api/mobile/kyc/presign – presigned POST for uploading one document straight to S3
+  POST /api/mobile/kyc/confirm – record a document uploaded via /presign
   GET  /api/mobile/kyc/status  – read current KYC status + rejection reason
 """
 from datetime import datetime
@@ -11,7 +13,11 @@ from app.db.session import get_db
 from app.db.models import KYCStatus, UserProfile
 from app.services.kyc_service import kyc_service
 from app.routes.mobile import get_current_user
-from app.schemas.mobile import MobileKYCUploadResponse, MobileKYCStatusResponse
+from app.schemas.mobile import (
+    MobileKYCUploadResponse, MobileKYCStatusResponse,
+    MobileKYCPresignRequest, MobileKYCPresignResponse,
+    MobileKYCConfirmRequest, MobileKYCConfirmResponse,
+)
 from app.core.logging_config import logger
 
 router = APIRouter(tags=["Mobile KYC"])
@@ -91,6 +97,67 @@ async def mobile_kyc_upload(
     return {"success": True, "kyc_status": "PENDING"}
 
 
+@router.post("/presign", response_model=MobileKYCPresignResponse)
+def mobile_kyc_presign(
+    payload: MobileKYCPresignRequest,
+    current_user: UserProfile = Depends(get_current_user),
+):
+    """
+    Create a presigned POST for one KYC document. JWT required.
+    The client POSTs the file with the returned fields to the returned url,
+    then calls /confirm with the returned key. The file never passes
+    through this server.
+    """
+    try:
+        presigned = kyc_service.create_kyc_upload(
+            current_user.id, payload.document_type, payload.content_type
+        )
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Direct uploads are not available. Use /api/mobile/kyc/upload.",
+        )
+    if not presigned:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not create upload. Allowed types: image/jpeg, image/png, application/pdf. Max size: 10 MB.",
+        )
+    return presigned
+
+
+@router.post("/confirm", response_model=MobileKYCConfirmResponse)
+def mobile_kyc_confirm(
+    payload: MobileKYCConfirmRequest,
+    db: Session = Depends(get_db),
+    current_user: UserProfile = Depends(get_current_user),
+):
+    """
+    Record a KYC document uploaded through /presign. JWT required.
+    Stores the document URL on the profile; KYC moves to PENDING once
+    all documents are present.
+    """
+    user_id = current_user.id
+
+    try:
+        url = kyc_service.record_kyc_document(db, user_id, payload.document_type, payload.key)
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Direct uploads are not available. Use /api/mobile/kyc/upload.",
+        )
+    if not url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{payload.document_type} could not be recorded. Upload the file first and use the key returned by /presign.",
+        )
+
+    user = db.query(UserProfile).filter(UserProfile.id == user_id).first()
+    kyc_val = user.kyc_status
+    kyc_str = kyc_val.value if hasattr(kyc_val, "value") else str(kyc_val)
+
+    return {"success": True, "url": url, "kyc_status": kyc_str}
+
+
 @router.get("/status", response_model=MobileKYCStatusResponse)
 def mobile_kyc_status(
     current_user: UserProfile = Depends(get_current_user),
@@ -3,6 +3,7 @@ Booking routes for order management and payment integration
 """
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 import uuid
 from fastapi import (
     APIRouter, Depends, File, HTTPException, Request,
@@ -21,7 +22,7 @@ from app.services.ccavenue_service import ccavenue_service
 from app.core.logging_config import logger
 from app.core.config import settings
 from app.core.templates import templates
-from app.utils.file_utils import upload_file_to_s3
+from app.utils.file_utils import upload_file_to_s3_async
 from typing import Optional
 
 router = APIRouter(
@@ -61,12 +62,10 @@ def view_orders(
             UserProfile.id == current_user["user_id"]
         ).first()
         
-        # Build query with car relationship loaded
+        # Build query; the car relationship is eager-loaded with the page
         from sqlalchemy.orm import joinedload
         from app.db.models import Cars, Reviews
-        query = db.query(Orders).options(
-            joinedload(Orders.car)
-        ).filter(
+        query = db.query(Orders).filter(
             Orders.user_id == user.id
         ).order_by(Orders.id.desc())
         
@@ -74,7 +73,9 @@ def view_orders(
         page_size = min(max(1, page_size), 100)  # Between 1 and 100
         
         # Paginate
-        orders, pagination = paginate_query(query, page=page, page_size=page_size)
+        orders, pagination = paginate_query(
+            query, page=page, page_size=page_size, eager=[joinedload(Orders.car)]
+        )
         
         # Get review status for each order
         order_review_status = {}
@@ -264,54 +265,30 @@ async def checkout_order(
         if not user.phone:
             user.phone = phone
         
-        # Upload documents if provided
-        if aadhaar_front and not user.aadhaar_front:
-            aadhaar_front.filename = f"{uuid.uuid4()}.jpg"
-            contents = await aadhaar_front.read()
-            with open(f"{settings.IMAGE_DIR}{aadhaar_front.filename}", 'wb') as f:
-                f.write(contents)
-                aadhaar_front_url = upload_file_to_s3(
-                    filepath=f.name,
-                    bucket_name=settings.S3_BUCKET_NAME,
-                    object_name=aadhaar_front.filename
-                )
-                user.aadhaar_front = aadhaar_front_url
-        
-        if aadhaar_back and not user.aadhaar_back:
-            aadhaar_back.filename = f"{uuid.uuid4()}.jpg"
-            contents = await aadhaar_back.read()
-            with open(f"{settings.IMAGE_DIR}{aadhaar_back.filename}", 'wb') as f:
-                f.write(contents)
-                aadhaar_back_url = upload_file_to_s3(
-                    filepath=f.name,
-                    bucket_name=settings.S3_BUCKET_NAME,
-                    object_name=aadhaar_back.filename
-                )
-                user.aadhaar_back = aadhaar_back_url
-        
-        if drivinglicense_front and not user.drivinglicense_front:
-            drivinglicense_front.filename = f"{uuid.uuid4()}.jpg"
-            contents = await drivinglicense_front.read()
-            with open(f"{settings.IMAGE_DIR}{drivinglicense_front.filename}", 'wb') as f:
-                f.write(contents)
-                drivinglicense_front_url = upload_file_to_s3(
-                    filepath=f.name,
-                    bucket_name=settings.S3_BUCKET_NAME,
-                    object_name=drivinglicense_front.filename
-                )
-                user.drivinglicense_front = drivinglicense_front_url
-        
-        if drivinglicense_back and not user.drivinglicense_back:
-            drivinglicense_back.filename = f"{uuid.uuid4()}.jpg"
-            contents = await drivinglicense_back.read()
-            with open(f"{settings.IMAGE_DIR}{drivinglicense_back.filename}", 'wb') as f:
-                f.write(contents)
-                drivinglicense_back_url = upload_file_to_s3(
-                    filepath=f.name,
+        # Upload documents if provided (S3 uploads run concurrently)
+        pending_uploads = []
+        for field, document in (
+            ("aadhaar_front", aadhaar_front),
+            ("aadhaar_back", aadhaar_back),
+            ("drivinglicense_front", drivinglicense_front),
+            ("drivinglicense_back", drivinglicense_back),
+        ):
+            if document and not getattr(user, field):
+                document.filename = f"{uuid.uuid4()}.jpg"
+                contents = await document.read()
+                local_path = f"{settings.IMAGE_DIR}{document.filename}"
+                with open(local_path, 'wb') as f:
+                    f.write(contents)
+                pending_uploads.append((field, upload_file_to_s3_async(
+                    filepath=local_path,
                     bucket_name=settings.S3_BUCKET_NAME,
-                    object_name=drivinglicense_back.filename
-                )
-                user.drivinglicense_back = drivinglicense_back_url
+                    object_name=document.filename
+                )))
+        
+        if pending_uploads:
+            urls = await asyncio.gather(*(upload for _, upload in pending_uploads))
+            for (field, _), url in zip(pending_uploads, urls):
+                setattr(user, field, url)
         
         db.add(user)
         db.commit()
@@ -343,13 +320,17 @@ async def checkout_order(
 
         # Get initial pricing breakdown
         from app.services.payment_calculation import payment_calculation_service
-        pricing_breakdown = payment_calculation_service.calculate_pricing_breakdown(
+        from app.schemas.payment import PricingInput
+        pricing_input = PricingInput(
             base_price=float(car.base_price),
             damage_price=float(car.damage_price),
             hours=hours,
             damage_protection=0,  # Default to no protection initially
             deposit=float(car.prices.get('deposit', 0)) if car.prices else 0.0
         )
+        pricing_breakdown = payment_calculation_service.calculate_pricing_breakdown(
+            **pricing_input.model_dump()
+        )
 
         # Render payment page with all necessary context
         return templates.TemplateResponse(
@@ -1,11 +1,12 @@
 """
 Customer-facing offer/coupon routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.routes.auth import get_current_user
+from app.schemas.offer import CouponValidateRequest
 from app.services.offer_service import offer_service
 from app.core.logging_config import logger
 
@@ -18,9 +19,7 @@ router = APIRouter(
 
 @router.post("/validate")
 async def validate_coupon(
-    coupon_code: str = Query(...),
-    car_id: int = Query(...),
-    total_amount: float = Query(...),
+    params: CouponValidateRequest = Depends(),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -28,9 +27,7 @@ async def validate_coupon(
     Validate a coupon code for a customer
     
     Args:
-        coupon_code: Coupon code to validate
-        car_id: Car ID for the booking
-        total_amount: Total booking amount before discount
+        params: Coupon code (normalized), car ID and total booking amount
         db: Database session
         current_user: Current authenticated user
         
@@ -46,10 +43,10 @@ async def validate_coupon(
     try:
         result = offer_service.validate_coupon(
             db=db,
-            coupon_code=coupon_code,
+            coupon_code=params.coupon_code,
             user_id=current_user["user_id"],
-            car_id=car_id,
-            total_amount=total_amount
+            car_id=params.car_id,
+            total_amount=params.total_amount
         )
         
         return result
@@ -5,6 +5,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Form, Request, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy.orm import Session
+from pydantic import ValidationError
 from datetime import datetime
 import uuid
 
@@ -16,6 +17,7 @@ from app.services.offer_service import offer_service
 from app.core.logging_config import logger
 from app.routes.auth import get_current_user
 from app.core.config import settings
+from app.schemas.payment import PricingInput
 
 router = APIRouter(
     prefix="/payments",
@@ -53,6 +55,8 @@ async def calculate_price(
         hours = body.get("hours")
         damage_protection = body.get("damage_protection", 0)  # 0, 277, or 477
         coupon_code = body.get("coupon_code")
+        if coupon_code:
+            coupon_code = coupon_code.strip().upper()
         
         if not car_id or not hours:
             raise HTTPException(
@@ -60,10 +64,6 @@ async def calculate_price(
                 detail="car_id and hours are required"
             )
         
-        # Validate damage_protection value
-        if damage_protection not in [0, 277, 477]:
-            damage_protection = 0  # Default to 0 if invalid
-        
         # Get car from database
         from app.db.models import Cars
         car = db.query(Cars).filter(Cars.id == car_id).first()
@@ -74,6 +74,21 @@ async def calculate_price(
                 detail="Car not found"
             )
         
+        # Validate pricing inputs once at the boundary
+        try:
+            pricing_input = PricingInput(
+                base_price=float(car.base_price),
+                damage_price=float(car.damage_price),
+                hours=hours,
+                damage_protection=damage_protection,
+                deposit=float(car.prices.deposit) if car.prices and car.prices.deposit else 0.0
+            )
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid pricing input: {e.errors()[0].get('msg')}"
+            )
+        
         # Calculate pricing using backend service
         from app.services.payment_calculation import payment_calculation_service
         
@@ -84,26 +99,24 @@ async def calculate_price(
             from app.services.offer_service import offer_service
             # Get subtotal for coupon validation
             base_rental = payment_calculation_service.calculate_rental_price(
-                float(car.base_price), hours
+                pricing_input.base_price, pricing_input.hours
+            )
+            protection_fee = payment_calculation_service.calculate_protection_fee(
+                pricing_input.damage_protection
             )
-            protection_fee = payment_calculation_service.calculate_protection_fee(damage_protection)
             subtotal = base_rental + protection_fee
             
             coupon_result = offer_service.validate_coupon(
-                db, coupon_code, car_id, subtotal
+                db, coupon_code, current_user["user_id"], car_id, subtotal
             )
             if coupon_result.get("valid"):
                 discount_amount = coupon_result.get("discount_amount", 0)
                 coupon_id = coupon_result.get("coupon_id")
+        pricing_input.discount_amount = discount_amount
         
         # Calculate pricing breakdown
         pricing_breakdown = payment_calculation_service.calculate_pricing_breakdown(
-            base_price=float(car.base_price),
-            damage_price=float(car.damage_price),
-            hours=hours,
-            damage_protection=damage_protection,
-            deposit=float(car.prices.deposit) if car.prices and car.prices.deposit else 0.0,
-            discount_amount=discount_amount
+            **pricing_input.model_dump()
         )
         
         return {
@@ -611,7 +624,7 @@ async def payment_callback(
                         user_name = f"{user.firstname} {user.lastname}".strip() or user.username
                         car_name = f"{car.brand} {car.car_model}"
                         
-                        email_service.send_booking_confirmation(
+                        email_service.send_booking_confirmation_async(
                             to_email=user.email,
                             user_name=user_name,
                             booking_id=str(order.id),
@@ -628,7 +641,7 @@ async def payment_callback(
                             payment_mode=payment_mode,
                             tracking_id=tracking_id
                         )
-                        logger.info(f"Booking confirmation email sent to {user.email} for order {order.id}")
+                        logger.info(f"Booking confirmation email queued for {user.email} for order {order.id}")
                     else:
                         logger.warning(f"Car not found for order {order.id}, skipping email")
                 else:
@@ -3,7 +3,7 @@ Pydantic schemas for all Mobile API endpoints.
 Kept separate from web schemas to avoid coupling.
 """
 from __future__ import annotations
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -69,6 +69,32 @@ class MobileKYCStatusResponse(BaseModel):
     reason: Optional[str] = None
 
 
+class MobileKYCPresignRequest(BaseModel):
+    """Request schema for POST /api/mobile/kyc/presign"""
+    document_type: str  # aadhaar_front, aadhaar_back, dl_front, dl_back
+    content_type: str   # image/jpeg, image/png, application/pdf
+
+
+class MobileKYCPresignResponse(BaseModel):
+    """Response schema for POST /api/mobile/kyc/presign"""
+    url: str
+    fields: Dict[str, str]
+    key: str
+
+
+class MobileKYCConfirmRequest(BaseModel):
+    """Request schema for POST /api/mobile/kyc/confirm"""
+    document_type: str
+    key: str
+
+
+class MobileKYCConfirmResponse(BaseModel):
+    """Response schema for POST /api/mobile/kyc/confirm"""
+    success: bool
+    url: str
+    kyc_status: str
+
+
 # ─────────────────────────────────────────────
 # Booking – Calculate
 # ─────────────────────────────────────────────
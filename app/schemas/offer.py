@@ -4,7 +4,7 @@ Pydantic schemas for Offer/Coupon operations
 from __future__ import annotations
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 class OfferCreate(BaseModel):
@@ -20,6 +20,12 @@ class OfferCreate(BaseModel):
     applicable_to_car_ids: Optional[List[int]] = None
     description: Optional[str] = None
     is_active: bool = True
+    
+    @field_validator('coupon_code')
+    @classmethod
+    def normalize_coupon_code(cls, v):
+        """Store coupon codes stripped and upper-cased"""
+        return v.strip().upper()
 
 
 class OfferUpdate(BaseModel):
@@ -35,6 +41,27 @@ class OfferUpdate(BaseModel):
     applicable_to_car_ids: Optional[List[int]] = None
     description: Optional[str] = None
     is_active: Optional[bool] = None
+    
+    @field_validator('coupon_code')
+    @classmethod
+    def normalize_coupon_code(cls, v):
+        """Store coupon codes stripped and upper-cased"""
+        if v is None:
+            return None
+        return v.strip().upper()
+
+
+class CouponValidateRequest(BaseModel):
+    """Schema for customer coupon validation"""
+    coupon_code: str
+    car_id: int
+    total_amount: float
+    
+    @field_validator('coupon_code')
+    @classmethod
+    def normalize_coupon_code(cls, v):
+        """Match the normalized form coupon codes are stored in"""
+        return v.strip().upper()
 
 
 class OfferResponse(BaseModel):
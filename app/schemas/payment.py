@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from typing import Optional
+from pydantic import BaseModel, Field, field_validator
 
 class PaymentInitiateRequest(BaseModel):
     """Schema for mobile payment initiation request"""
@@ -22,3 +23,24 @@ class PaymentVerifyResponse(BaseModel):
     message: str
     payment_status: str
     booking_status: str
+
+
+class PricingInput(BaseModel):
+    """Validated inputs for PaymentCalculationService.calculate_pricing_breakdown"""
+    base_price: float = Field(..., ge=0)
+    damage_price: float = Field(0.0, ge=0)
+    hours: int = Field(..., ge=0)
+    damage_protection: int = 0  # 0, 277, or 477
+    deposit: float = Field(0.0, ge=0)
+    other_charges: float = Field(0.0, ge=0)
+    discount_amount: Optional[float] = Field(None, ge=0)
+    
+    @field_validator('damage_protection', mode='before')
+    @classmethod
+    def default_unknown_protection(cls, v):
+        """Fall back to no protection for unknown levels"""
+        try:
+            v = int(v)
+        except (TypeError, ValueError):
+            return 0
+        return v if v in (0, 277, 477) else 0
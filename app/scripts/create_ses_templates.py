@@ -0,0 +1,32 @@
+"""
+Script to create or update the SES email templates used by EmailService.
+
+Run once per environment (and again whenever the templates change). Bulk KYC
+approval emails require the KycApproved template; set SES_USE_TEMPLATES=true
+to have booking emails rendered by SES as well.
+"""
+from botocore.exceptions import ClientError
+
+from app.core.config import settings
+from app.utils.email_service import (
+    email_service, booking_confirmation_ses_template, kyc_approved_ses_template
+)
+
+
+def create_ses_templates():
+    templates = [booking_confirmation_ses_template(), kyc_approved_ses_template()]
+    for template in templates:
+        name = template['TemplateName']
+        try:
+            email_service.ses_client.create_template(Template=template)
+            print(f"Created SES template: {name}")
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'AlreadyExists':
+                email_service.ses_client.update_template(Template=template)
+                print(f"Updated SES template: {name}")
+            else:
+                print(f"Error creating SES template {name}: {str(e)}")
+
+if __name__ == "__main__":
+    print(f"SES Region: {settings.SES_REGION}")
+    create_ses_templates()
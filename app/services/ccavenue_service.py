@@ -3,8 +3,14 @@ CCAvenue payment gateway service
 Handles order creation, encryption, decryption, and payment verification
 Uses official CCAvenue Python kit for encryption/decryption
 """
+import json
+import logging
 import urllib.parse
 from typing import Dict, Optional, Any
+
+import httpx
+import orjson
+
 from app.core.config import settings
 from app.core.logging_config import logger
 from app.utils.ccavutil import encrypt, decrypt
@@ -32,6 +38,13 @@ class CCAvenueService:
             self.payment_url = "https://test.ccavenue.com/transaction/transaction.do?command=initiateTransaction"
             self.status_url = "https://test.ccavenue.com/transaction/getStatusByJson"
         
+        # Shared HTTP client so status polls reuse keep-alive connections
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=5.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+        
         logger.info(f"CCAvenue service initialized with environment: {self.environment}")
     
     
@@ -173,7 +186,8 @@ class CCAvenueService:
         if not self.working_key:
             raise ValueError("Working key is not configured")
         
-        logger.info(f"Encrypting order data: {order_data}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Encrypting order data: %s", orjson.dumps(order_data, default=str).decode())
         
         try:
             # Build query string from order data (exactly as per CCAvenue official kit)
@@ -239,7 +253,7 @@ class CCAvenueService:
             logger.error(f"Error verifying payment: {str(e)}", exc_info=True)
             raise
     
-    def get_payment_status(self, order_id: str) -> Dict[str, Any]:
+    async def get_payment_status(self, order_id: str) -> Dict[str, Any]:
         """
         Get payment status from CCAvenue
         
@@ -256,17 +270,38 @@ class CCAvenueService:
                 "order_no": order_id,
             }
             
-            # This would typically make an API call to CCAvenue
-            # For now, return a placeholder
             logger.info(f"Checking payment status for order: {order_id}")
             
-            return {
-                "status": "pending",
-                "message": "Status check not implemented"
-            }
+            enc_request = encrypt(json.dumps(request_data), self.working_key)
+            response = await self._client.post(
+                self.status_url,
+                data={
+                    "enc_request": enc_request,
+                    "access_code": self.access_code,
+                    "command": "orderStatusTracker",
+                    "request_type": "JSON",
+                    "response_type": "JSON",
+                    "version": "1.2",
+                }
+            )
+            response.raise_for_status()
+            
+            # Response format: status=0&enc_response=... (status 1 carries an error message)
+            response_data = dict(urllib.parse.parse_qsl(response.text.strip()))
+            if response_data.get("status") != "0":
+                return {
+                    "status": "error",
+                    "message": response_data.get("enc_response", "Status check failed")
+                }
+            
+            return json.loads(decrypt(response_data["enc_response"].strip(), self.working_key))
         except Exception as e:
             logger.error(f"Error getting payment status: {str(e)}")
             raise
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        await self._client.aclose()
 
 
 # Create global instance
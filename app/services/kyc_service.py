@@ -1,10 +1,12 @@
 """
 KYC service for handling user KYC document uploads and verification
 """
-from typing import Optional, List
+from pathlib import Path
+import re
+from typing import Any, Dict, Optional, List
 from sqlalchemy.orm import Session
 
-from app.db.models import UserProfile
+from app.db.models import UserProfile, KYCStatus
 from app.core.logging_config import logger
 from app.utils.s3_service import s3_service
 
@@ -15,6 +17,21 @@ class KYCService:
     ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.pdf'}
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
     
+    # Content types accepted for direct-to-S3 uploads, with the extension used for the key
+    ALLOWED_CONTENT_TYPES = {
+        'image/jpeg': '.jpg',
+        'image/png': '.png',
+        'application/pdf': '.pdf',
+    }
+    
+    # document_type -> UserProfile column
+    DOCUMENT_FIELDS = {
+        'aadhaar_front': 'aadhaar_front',
+        'aadhaar_back': 'aadhaar_back',
+        'dl_front': 'drivinglicense_front',
+        'dl_back': 'drivinglicense_back',
+    }
+    
     @staticmethod
     def validate_file(file) -> bool:
         """
@@ -30,7 +47,6 @@ class KYCService:
             return False
         
         # Check file extension
-        from pathlib import Path
         file_ext = Path(file.filename).suffix.lower()
         if file_ext not in KYCService.ALLOWED_EXTENSIONS:
             return False
@@ -85,29 +101,8 @@ class KYCService:
             # Upload to S3
             s3_url = await s3_service.upload_kyc_document(file, user_id, document_type)
             
-            # Map document_type to model field
-            if document_type == 'aadhaar_front':
-                user.aadhaar_front = s3_url
-            elif document_type == 'aadhaar_back':
-                user.aadhaar_back = s3_url
-            elif document_type == 'dl_front':
-                user.drivinglicense_front = s3_url
-            elif document_type == 'dl_back':
-                user.drivinglicense_back = s3_url
-            
-            # Update KYC status if all documents are uploaded
-            if (user.aadhaar_front and user.aadhaar_back and 
-                user.drivinglicense_front and user.drivinglicense_back):
-                from app.db.models import KYCStatus
-                current_status = user.kyc_status
-                if hasattr(current_status, 'value'):
-                    current_status = current_status.value
-                
-                if current_status == 'NOT_SUBMITTED':
-                    user.kyc_status = KYCStatus.PENDING
-            
+            KYCService._set_document(user, document_type, s3_url)
             db.commit()
-            db.refresh(user)
             
             logger.info(f"KYC document uploaded for user {user_id}: {document_type}")
             return s3_url
@@ -117,6 +112,134 @@ class KYCService:
             db.rollback()
             return None
     
+    @staticmethod
+    def _set_document(user: UserProfile, document_type: str, url: str) -> None:
+        """Store a document URL on the user and move KYC to PENDING once complete"""
+        setattr(user, KYCService.DOCUMENT_FIELDS[document_type], url)
+        
+        # Update KYC status if all documents are uploaded
+        if user.kyc_complete:
+            current_status = user.kyc_status
+            if hasattr(current_status, 'value'):
+                current_status = current_status.value
+            
+            if current_status == 'NOT_SUBMITTED':
+                user.kyc_status = KYCStatus.PENDING
+    
+    @staticmethod
+    def create_kyc_upload(
+        user_id: int,
+        document_type: str,
+        content_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Create a presigned POST so the client uploads a KYC document straight to S3
+        
+        Args:
+            user_id: User ID
+            document_type: Type of document (aadhaar_front, aadhaar_back, dl_front, dl_back)
+            content_type: Content-Type of the file to upload
+            
+        Returns:
+            Dict with "url", "fields" and "key", or None
+            
+        Raises:
+            RuntimeError: If uploads go to local storage instead of S3
+        """
+        if s3_service.use_local_storage:
+            raise RuntimeError("Direct KYC uploads require S3; local storage is in use")
+        
+        if document_type not in KYCService.DOCUMENT_FIELDS:
+            logger.error(f"Invalid document type: {document_type}")
+            return None
+        
+        file_extension = KYCService.ALLOWED_CONTENT_TYPES.get(content_type)
+        if not file_extension:
+            logger.error(f"Invalid content type for {document_type}: {content_type}")
+            return None
+        
+        try:
+            return s3_service.generate_presigned_post(
+                folder=KYCService._kyc_folder(user_id, document_type),
+                content_type=content_type,
+                file_extension=file_extension,
+                max_size=KYCService.MAX_FILE_SIZE
+            )
+        except Exception as e:
+            logger.error(f"Error creating KYC upload: {str(e)}")
+            return None
+    
+    @staticmethod
+    def record_kyc_document(
+        db: Session,
+        user_id: int,
+        document_type: str,
+        key: str
+    ) -> Optional[str]:
+        """
+        Record a KYC document the client uploaded via create_kyc_upload
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            document_type: Type of document (aadhaar_front, aadhaar_back, dl_front, dl_back)
+            key: S3 object key returned by create_kyc_upload
+            
+        Returns:
+            S3 URL of the document or None
+            
+        Raises:
+            RuntimeError: If uploads go to local storage instead of S3
+        """
+        if s3_service.use_local_storage:
+            raise RuntimeError("Direct KYC uploads require S3; local storage is in use")
+        
+        try:
+            if document_type not in KYCService.DOCUMENT_FIELDS:
+                logger.error(f"Invalid document type: {document_type}")
+                return None
+            
+            # Only accept the exact key shape create_kyc_upload issues for this user and type
+            if not KYCService._issued_key_pattern(user_id, document_type).fullmatch(key):
+                logger.error(f"KYC key {key} was not issued to user {user_id} ({document_type})")
+                return None
+            
+            # The client must have completed the upload
+            if not s3_service.object_exists(key):
+                logger.error(f"KYC key {key} not found in S3 for user {user_id}")
+                return None
+            
+            user = db.query(UserProfile).filter(UserProfile.id == user_id).first()
+            if not user:
+                logger.error(f"User not found: {user_id}")
+                return None
+            
+            s3_url = s3_service.get_object_url(key)
+            KYCService._set_document(user, document_type, s3_url)
+            db.commit()
+            
+            logger.info(f"KYC document recorded for user {user_id}: {document_type}")
+            return s3_url
+            
+        except Exception as e:
+            logger.error(f"Error recording KYC document: {str(e)}")
+            db.rollback()
+            return None
+    
+    @staticmethod
+    def _kyc_folder(user_id: int, document_type: str) -> str:
+        """S3 prefix for a user's KYC document (matches S3Service.upload_kyc_document)"""
+        return f"users/{user_id}/kyc/{document_type}"
+    
+    @staticmethod
+    def _issued_key_pattern(user_id: int, document_type: str) -> "re.Pattern[str]":
+        """Regex for keys from S3Service.generate_presigned_post under this user's KYC folder"""
+        extensions = "|".join(
+            re.escape(ext.lstrip('.')) for ext in KYCService.ALLOWED_CONTENT_TYPES.values()
+        )
+        folder = re.escape(KYCService._kyc_folder(user_id, document_type))
+        return re.compile(rf"{folder}/[0-9a-f]{{32}}\.(?:{extensions})")
+    
     @staticmethod
     def get_missing_documents(user: UserProfile) -> List[str]:
         """
@@ -152,8 +275,7 @@ class KYCService:
         Returns:
             True if all documents are uploaded, False otherwise
         """
-        missing = KYCService.get_missing_documents(user)
-        return len(missing) == 0
+        return user.kyc_complete
 
 
 # Global instance
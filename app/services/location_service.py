@@ -2,9 +2,10 @@
 Location management service
 """
 from typing import List, Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from app.db.models import Location
+from app.db.models import Location, Cars
 from app.schemas.location import LocationCreate, LocationUpdate
 from app.core.logging_config import logger
 
@@ -39,7 +40,6 @@ class LocationService:
             )
             db.add(location)
             db.commit()
-            db.refresh(location)
             
             logger.info(f"Location created: {location.id} - {location.location}")
             return location
@@ -67,11 +67,7 @@ class LocationService:
             Updated location object or None
         """
         try:
-            location = db.query(Location).filter(Location.id == location_id).first()
-            if not location:
-                return None
-            
-            update_data = location_data.dict(exclude_unset=True)
+            update_data = location_data.model_dump(exclude_unset=True)
             
             # Check if new location name already exists
             if 'location' in update_data:
@@ -83,11 +79,18 @@ class LocationService:
                 if existing:
                     raise ValueError(f"Location '{update_data['location']}' already exists")
             
-            for key, value in update_data.items():
-                setattr(location, key, value)
+            if update_data:
+                # Targeted UPDATE of only the supplied columns
+                db.execute(
+                    update(Location)
+                    .where(Location.id == location_id)
+                    .values(**update_data)
+                )
+                db.commit()
             
-            db.commit()
-            db.refresh(location)
+            location = db.get(Location, location_id)
+            if not location:
+                return None
             
             logger.info(f"Location updated: {location_id}")
             return location
@@ -106,7 +109,6 @@ class LocationService:
                 return False
             
             # Check if location is in use by any cars
-            from app.db.models import Cars
             cars_using_location = db.query(Cars).filter(
                 Cars.location_id == location_id
             ).count()
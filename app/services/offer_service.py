@@ -1,7 +1,7 @@
 """
 Offer/Coupon service for validation and discount calculation
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
@@ -14,116 +14,184 @@ class OfferService:
     """Service for offer/coupon operations"""
     
     @staticmethod
-    def validate_coupon(
+    def fetch_coupons_by_codes(db: Session, codes: List[str]) -> Dict[str, Coupons]:
+        """
+        Fetch several usable coupons in a single query
+        
+        Inactive and expired coupons are filtered out in the database so the
+        lookup is served by the (coupon_code, is_active, expiration_time) index.
+        
+        Args:
+            db: Database session
+            codes: Normalized (stripped, upper-cased) coupon codes to look up
+            
+        Returns:
+            Dict mapping coupon code to coupon for every active, unexpired code
+        """
+        if not codes:
+            return {}
+        
+        coupons = db.query(Coupons).filter(
+            Coupons.coupon_code.in_(codes),
+            Coupons.is_active == True,
+            Coupons.expiration_time >= datetime.now()
+        ).all()
+        return {coupon.coupon_code: coupon for coupon in coupons}
+    
+    @staticmethod
+    def _evaluate_coupon(
         db: Session,
-        coupon_code: str,
-        user_id: int,
+        coupon: Optional[Coupons],
         car_id: int,
-        total_amount: float
+        total_amount: float,
+        car_cache: Dict[int, Optional[Cars]]
     ) -> Dict[str, Any]:
         """
-        Validate a coupon code and return discount information
+        Run the validation rules against an already loaded coupon
         
         Args:
             db: Database session
-            coupon_code: Coupon code to validate
-            user_id: User ID applying the coupon
+            coupon: Coupon to validate (None if missing, inactive or expired)
             car_id: Car ID for the booking
             total_amount: Total booking amount before discount
+            car_cache: Car lookups shared between coupons of the same request
             
         Returns:
             Dict with validation result and discount details
         """
-        try:
-            # Find coupon
-            coupon = db.query(Coupons).filter(
-                Coupons.coupon_code == coupon_code.upper().strip()
-            ).first()
-            
-            if not coupon:
-                return {
-                    "valid": False,
-                    "error": "Invalid coupon code"
-                }
-            
-            # Check if coupon is active
-            if not coupon.is_active:
-                return {
-                    "valid": False,
-                    "error": "This coupon is no longer active"
-                }
-            
-            # Check expiration
-            if coupon.expiration_time < datetime.now():
-                return {
-                    "valid": False,
-                    "error": "This coupon has expired"
-                }
-            
-            # Check usage limit
-            if coupon.usage_limit and coupon.usage_count >= coupon.usage_limit:
+        if not coupon:
+            return {
+                "valid": False,
+                "error": "Invalid coupon code"
+            }
+        
+        # Check usage limit
+        if coupon.usage_limit and coupon.usage_count >= coupon.usage_limit:
+            return {
+                "valid": False,
+                "error": "This coupon has reached its usage limit"
+            }
+        
+        # Check minimum amount
+        if coupon.min_amount and total_amount < coupon.min_amount:
+            return {
+                "valid": False,
+                "error": f"Minimum order amount of ₹{coupon.min_amount} required"
+            }
+        
+        # Check car type restrictions
+        if coupon.applicable_to_car_type:
+            if car_id not in car_cache:
+                car_cache[car_id] = db.query(Cars).filter(Cars.id == car_id).first()
+            car = car_cache[car_id]
+            if car and car.car_type.value not in coupon.applicable_to_car_type:
                 return {
                     "valid": False,
-                    "error": "This coupon has reached its usage limit"
+                    "error": f"This coupon is not applicable to {car.car_type.value} cars"
                 }
-            
-            # Check minimum amount
-            if coupon.min_amount and total_amount < coupon.min_amount:
+        
+        # Check specific car restrictions
+        if coupon.applicable_to_car_ids:
+            if car_id not in coupon.applicable_to_car_ids:
                 return {
                     "valid": False,
-                    "error": f"Minimum order amount of ₹{coupon.min_amount} required"
+                    "error": "This coupon is not applicable to this car"
                 }
+        
+        # Calculate discount
+        discount_amount = 0
+        if coupon.discount_type == "PERCENTAGE":
+            discount_amount = (total_amount * coupon.discount) / 100
+            # Apply max discount if set
+            if coupon.max_discount and discount_amount > coupon.max_discount:
+                discount_amount = coupon.max_discount
+        else:  # FIXED
+            discount_amount = coupon.discount
+            # Ensure discount doesn't exceed total amount
+            if discount_amount > total_amount:
+                discount_amount = total_amount
+        
+        final_amount = total_amount - discount_amount
+        
+        return {
+            "valid": True,
+            "coupon_id": coupon.id,
+            "coupon_code": coupon.coupon_code,
+            "discount_type": coupon.discount_type,
+            "discount_amount": round(discount_amount, 2),
+            "original_amount": round(total_amount, 2),
+            "final_amount": round(final_amount, 2),
+            "description": coupon.description
+        }
+    
+    @staticmethod
+    def validate_coupons(
+        db: Session,
+        coupon_codes: List[str],
+        user_id: int,
+        car_id: int,
+        total_amount: float
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate several coupon codes with a single lookup query
+        
+        Args:
+            db: Database session
+            coupon_codes: Normalized coupon codes to validate
+            user_id: User ID applying the coupons
+            car_id: Car ID for the booking
+            total_amount: Total booking amount before discount
             
-            # Check car type restrictions
-            if coupon.applicable_to_car_type:
-                car = db.query(Cars).filter(Cars.id == car_id).first()
-                if car and car.car_type.value not in coupon.applicable_to_car_type:
-                    return {
-                        "valid": False,
-                        "error": f"This coupon is not applicable to {car.car_type.value} cars"
-                    }
-            
-            # Check specific car restrictions
-            if coupon.applicable_to_car_ids:
-                if car_id not in coupon.applicable_to_car_ids:
-                    return {
-                        "valid": False,
-                        "error": "This coupon is not applicable to this car"
-                    }
-            
-            # Calculate discount
-            discount_amount = 0
-            if coupon.discount_type == "PERCENTAGE":
-                discount_amount = (total_amount * coupon.discount) / 100
-                # Apply max discount if set
-                if coupon.max_discount and discount_amount > coupon.max_discount:
-                    discount_amount = coupon.max_discount
-            else:  # FIXED
-                discount_amount = coupon.discount
-                # Ensure discount doesn't exceed total amount
-                if discount_amount > total_amount:
-                    discount_amount = total_amount
-            
-            final_amount = total_amount - discount_amount
+        Returns:
+            Dict mapping each coupon code to its validation result
+        """
+        try:
+            coupons = OfferService.fetch_coupons_by_codes(db, coupon_codes)
+            car_cache: Dict[int, Optional[Cars]] = {}
             
             return {
-                "valid": True,
-                "coupon_id": coupon.id,
-                "coupon_code": coupon.coupon_code,
-                "discount_type": coupon.discount_type,
-                "discount_amount": round(discount_amount, 2),
-                "original_amount": round(total_amount, 2),
-                "final_amount": round(final_amount, 2),
-                "description": coupon.description
+                code: OfferService._evaluate_coupon(
+                    db, coupons.get(code), car_id, total_amount, car_cache
+                )
+                for code in coupon_codes
             }
             
         except Exception as e:
-            logger.error(f"Error validating coupon: {str(e)}")
+            logger.error(f"Error validating coupons: {str(e)}")
             return {
-                "valid": False,
-                "error": "An error occurred while validating the coupon"
+                code: {
+                    "valid": False,
+                    "error": "An error occurred while validating the coupon"
+                }
+                for code in coupon_codes
             }
     
+    @staticmethod
+    def validate_coupon(
+        db: Session,
+        coupon_code: str,
+        user_id: int,
+        car_id: int,
+        total_amount: float
+    ) -> Dict[str, Any]:
+        """
+        Validate a coupon code and return discount information
+        
+        Args:
+            db: Database session
+            coupon_code: Normalized coupon code to validate
+            user_id: User ID applying the coupon
+            car_id: Car ID for the booking
+            total_amount: Total booking amount before discount
+            
+        Returns:
+            Dict with validation result and discount details
+        """
+        results = OfferService.validate_coupons(
+            db, [coupon_code], user_id, car_id, total_amount
+        )
+        return results[coupon_code]
+    
     @staticmethod
     def apply_coupon(db: Session, coupon_id: int) -> bool:
         """
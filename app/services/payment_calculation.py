@@ -6,13 +6,17 @@ from typing import Dict, Optional
 from datetime import datetime
 import math
 
-from app.core.logging_config import logger
-
 
 class PaymentCalculationService:
     """Service for payment calculations"""
     
     GST_RATE = 0.18  # 18% GST
+    GST_PERCENT = 18
+    
+    @staticmethod
+    def _to_paise(amount: float) -> int:
+        """Convert a rupee amount to integer paise"""
+        return int(round(amount * 100))
     
     @staticmethod
     def calculate_rental_price(
@@ -144,49 +148,48 @@ class PaymentCalculationService:
             
         Returns:
             Dictionary with all pricing components
-        """
-        try:
-            base_rental = PaymentCalculationService.calculate_rental_price(base_price, hours)
-            protection_fee = PaymentCalculationService.calculate_protection_fee(damage_protection)
-            
-            # Calculate subtotal before discount
-            subtotal_before_discount = base_rental + protection_fee + other_charges
-            
-            # Apply discount if provided
-            discount_applied = 0.0
-            if discount_amount:
-                discount_applied = min(discount_amount, subtotal_before_discount)
-                subtotal_after_discount = subtotal_before_discount - discount_applied
-            else:
-                subtotal_after_discount = subtotal_before_discount
-            
-            # GST is calculated on the discounted amount (base_rental + protection_fee after discount)
-            # Calculate GST on the subtotal after discount
-            gst = subtotal_after_discount * PaymentCalculationService.GST_RATE
-            
-            total = subtotal_after_discount + gst
             
-            # Calculate damage liability (using max damage price as reference)
-            # This shows what the liability would be for maximum damage
-            damage_liability = PaymentCalculationService.get_damage_liability(
-                damage_protection, damage_price
-            )
-            
-            return {
-                "base_rental": round(base_rental, 2),
-                "protection_fee": round(protection_fee, 2),
-                "gst": round(gst, 2),
-                "other_charges": round(other_charges, 2),
-                "subtotal": round(subtotal_after_discount, 2),
-                "discount": round(discount_applied, 2),
-                "total": round(total, 2),
-                "deposit": round(deposit, 2),
-                "damage_liability": round(damage_liability, 2),
-                "hours": hours
-            }
-        except Exception as e:
-            logger.error(f"Error calculating pricing breakdown: {str(e)}")
-            raise
+        Inputs are expected to be validated upstream (see app.schemas.payment.PricingInput)
+        """
+        # All amounts are kept in integer paise and converted back once at the end
+        # Rental (per started day) and protection fee inlined from
+        # calculate_rental_price / calculate_protection_fee
+        to_paise = PaymentCalculationService._to_paise
+        base_rental = to_paise(base_price) * math.ceil(max(1, hours) / 24)
+        protection_fee = int(damage_protection) * 100
+        other = to_paise(other_charges)
+        
+        # Calculate subtotal before discount
+        subtotal_before_discount = base_rental + protection_fee + other
+        
+        # Apply discount if provided
+        discount_applied = 0
+        if discount_amount:
+            discount_applied = min(to_paise(discount_amount), subtotal_before_discount)
+        subtotal_after_discount = subtotal_before_discount - discount_applied
+        
+        # GST is calculated on the subtotal after discount (rounded half-up to the paisa)
+        total = (subtotal_after_discount * (100 + PaymentCalculationService.GST_PERCENT) + 50) // 100
+        gst = total - subtotal_after_discount
+        
+        # Calculate damage liability (using max damage price as reference)
+        # This shows what the liability would be for maximum damage
+        damage_liability = to_paise(PaymentCalculationService.get_damage_liability(
+            damage_protection, damage_price
+        ))
+        
+        return {
+            "base_rental": base_rental / 100,
+            "protection_fee": protection_fee / 100,
+            "gst": gst / 100,
+            "other_charges": other / 100,
+            "subtotal": subtotal_after_discount / 100,
+            "discount": discount_applied / 100,
+            "total": total / 100,
+            "deposit": to_paise(deposit) / 100,
+            "damage_liability": damage_liability / 100,
+            "hours": hours
+        }
 
 
 # Global instance
@@ -8,6 +8,14 @@ from app.db.models import UserProfile
 from app.core.config import settings
 from app.core.logging_config import logger
 
+# Shared Cognito client (boto3 clients are thread-safe once constructed)
+_cognito_client = boto3.client(
+    "cognito-idp",
+    region_name=settings.AWS_REGION,
+    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+)
+
 
 def create_user_if_not_exists(token_data: Dict, db: Session) -> UserProfile:
     """
@@ -30,15 +38,8 @@ def create_user_if_not_exists(token_data: Dict, db: Session) -> UserProfile:
             return user
         
         # Get user attributes from Cognito
-        cognito_client = boto3.client(
-            "cognito-idp",
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        
         try:
-            cognito_user = cognito_client.admin_get_user(
+            cognito_user = _cognito_client.admin_get_user(
                 UserPoolId=settings.USERPOOL_ID,
                 Username=token_data.get("username")
             )
@@ -62,7 +63,7 @@ def create_user_if_not_exists(token_data: Dict, db: Session) -> UserProfile:
             logger.info(f"User created: {new_user.username}")
             return new_user
             
-        except cognito_client.exceptions.UserNotFoundException:
+        except _cognito_client.exceptions.UserNotFoundException:
             logger.error(f"User not found in Cognito: {token_data.get('username')}")
             raise
         except Exception as e:
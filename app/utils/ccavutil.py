@@ -4,23 +4,58 @@ CCAvenue encryption/decryption utilities
 Official CCAvenue Python kit - Python 3 compatible version
 """
 
-from Crypto.Cipher import AES
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.backends import default_backend
+from functools import lru_cache
 import hashlib
 
 
-def pad(data):
+def pad(data: bytes) -> bytes:
     """
     Pad data to be multiple of 16 bytes (AES block size)
     
     Args:
-        data: String to pad
+        data: Bytes to pad
         
     Returns:
-        Padded string
+        PKCS7-padded bytes
     """
     length = 16 - (len(data) % 16)
-    data += chr(length) * length
-    return data
+    return data + bytes((length,)) * length
+
+
+@lru_cache(maxsize=8)
+def _derive_key(working_key):
+    """
+    Derive the AES key (MD5 digest) for a CCAvenue working key
+    
+    Args:
+        working_key: CCAvenue working key
+        
+    Returns:
+        16-byte AES key
+    """
+    return hashlib.md5(working_key.encode('utf-8')).digest()
+
+
+@lru_cache(maxsize=8)
+def _cipher(working_key):
+    """
+    Shared AES-CBC cipher for a CCAvenue working key
+    
+    Cipher objects hold no stream state (each encryptor()/decryptor() starts a
+    fresh CBC chain from the IV), so one instance is safely reused by
+    encrypt/decrypt across calls and threads.
+    
+    Args:
+        working_key: CCAvenue working key
+        
+    Returns:
+        Cipher bound to the derived key and the fixed CCAvenue IV
+    """
+    # Fixed IV as per CCAvenue specification
+    iv = b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f'
+    return Cipher(algorithms.AES(_derive_key(working_key)), modes.CBC(iv), backend=default_backend())
 
 
 def encrypt(plain_text, working_key):
@@ -34,22 +69,34 @@ def encrypt(plain_text, working_key):
     Returns:
         Hex-encoded encrypted string
     """
-    # Fixed IV as per CCAvenue specification
-    iv = b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f'
+    # Encode once and pad the plain text bytes
+    padded_text = pad(plain_text.encode('utf-8'))
     
-    # Pad the plain text
-    padded_text = pad(plain_text)
-    
-    # Create MD5 hash of working key
-    enc_digest = hashlib.md5()
-    enc_digest.update(working_key.encode('utf-8'))
+    # Encrypt with the cached cipher for this key and convert to hex
+    encryptor = _cipher(working_key).encryptor()
+    encrypted_text = encryptor.update(padded_text) + encryptor.finalize()
+    return encrypted_text.hex()
+
+
+def encrypt_many(plain_texts, working_key):
+    """
+    Encrypt several plain texts with the same CCAvenue working key
     
-    # Create AES cipher with MD5 hash as key
-    enc_cipher = AES.new(enc_digest.digest(), AES.MODE_CBC, iv)
+    Args:
+        plain_texts: List of plain text strings to encrypt
+        working_key: CCAvenue working key
+        
+    Returns:
+        List of hex-encoded encrypted strings, in input order
+    """
+    # Each encryptor() of the cached cipher starts a fresh CBC chain from the IV
+    enc_cipher = _cipher(working_key)
     
-    # Encrypt and convert to hex
-    encrypted_text = enc_cipher.encrypt(padded_text.encode('utf-8'))
-    return encrypted_text.hex()
+    encrypted = []
+    for plain_text in plain_texts:
+        encryptor = enc_cipher.encryptor()
+        encrypted.append((encryptor.update(pad(plain_text.encode('utf-8'))) + encryptor.finalize()).hex())
+    return encrypted
 
 
 def decrypt(cipher_text, working_key):
@@ -63,28 +110,19 @@ def decrypt(cipher_text, working_key):
     Returns:
         Decrypted string
     """
-    # Fixed IV as per CCAvenue specification
-    iv = b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f'
-    
-    # Create MD5 hash of working key
-    dec_digest = hashlib.md5()
-    dec_digest.update(working_key.encode('utf-8'))
-    
     # Convert hex string to bytes
     encrypted_text = bytes.fromhex(cipher_text)
     
-    # Create AES cipher with MD5 hash as key
-    dec_cipher = AES.new(dec_digest.digest(), AES.MODE_CBC, iv)
-    
-    # Decrypt
-    decrypted_text = dec_cipher.decrypt(encrypted_text)
+    # Decrypt with the cached cipher for this key
+    decryptor = _cipher(working_key).decryptor()
+    decrypted_text = decryptor.update(encrypted_text) + decryptor.finalize()
     
     # Remove PKCS7 padding (last byte indicates padding length)
     # Padding length should be between 1 and 16
+    # If padding is invalid, keep the full text (some responses might not have proper padding)
     padding_length = decrypted_text[-1]
-    if 1 <= padding_length <= 16:
-        decrypted_text = decrypted_text[:-padding_length]
-    # If padding is invalid, try to decode anyway (some responses might not have proper padding)
+    end = len(decrypted_text) - (padding_length if 1 <= padding_length <= 16 else 0)
+    decrypted_text = decrypted_text[:end]
     
     return decrypted_text.decode('utf-8', errors='ignore')
 
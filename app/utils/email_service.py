@@ -1,161 +1,25 @@
 """
 AWS SES email service for sending emails
 """
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict, Any, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import re
+import time
 import boto3
 from botocore.exceptions import ClientError
+from jinja2 import Environment
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import json
+import orjson
 
 from app.core.config import settings
 from app.core.logging_config import logger
 
 
-class EmailService:
-    """Service for sending emails via AWS SES"""
-    
-    def __init__(self):
-        self.ses_client = boto3.client(
-            'ses',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.SES_REGION
-        )
-        self.from_email = settings.SES_FROM_EMAIL
-        self.from_name = settings.SES_FROM_NAME
-    
-    def send_email(
-        self,
-        to_email: str,
-        subject: str,
-        body_text: str,
-        body_html: Optional[str] = None,
-        cc: Optional[List[str]] = None,
-        bcc: Optional[List[str]] = None
-    ) -> bool:
-        """
-        Send an email via AWS SES
-        
-        Args:
-            to_email: Recipient email address
-            subject: Email subject
-            body_text: Plain text body
-            body_html: HTML body (optional)
-            cc: CC recipients (optional)
-            bcc: BCC recipients (optional)
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            destination = {
-                'ToAddresses': [to_email]
-            }
-            
-            if cc:
-                destination['CcAddresses'] = cc
-            if bcc:
-                destination['BccAddresses'] = bcc
-            
-            message = {
-                'Subject': {'Data': subject, 'Charset': 'UTF-8'}
-            }
-            
-            body = {
-                'Text': {'Data': body_text, 'Charset': 'UTF-8'}
-            }
-            
-            if body_html:
-                body['Html'] = {'Data': body_html, 'Charset': 'UTF-8'}
-            
-            message['Body'] = body
-            
-            response = self.ses_client.send_email(
-                Source=f"{self.from_name} <{self.from_email}>",
-                Destination=destination,
-                Message=message
-            )
-            
-            logger.info(f"Email sent successfully to {to_email}. MessageId: {response['MessageId']}")
-            return True
-            
-        except ClientError as e:
-            logger.error(f"Error sending email: {str(e)}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error sending email: {str(e)}")
-            return False
-    
-    def send_booking_confirmation(
-        self,
-        to_email: str,
-        user_name: str,
-        booking_id: str,
-        car_name: str,
-        car_brand: str,
-        car_model: str,
-        registration_number: Optional[str],
-        start_date: str,
-        end_date: str,
-        pickup_location: Optional[str],
-        drop_location: Optional[str],
-        total_amount: float,
-        advance_amount: float,
-        payment_mode: Optional[str] = None,
-        tracking_id: Optional[str] = None
-    ) -> bool:
-        """
-        Send booking confirmation email with beautiful HTML template
-        
-        Args:
-            to_email: Recipient email
-            user_name: User's name
-            booking_id: Booking ID
-            car_name: Car name
-            car_brand: Car brand
-            car_model: Car model
-            registration_number: Car registration number
-            start_date: Start date
-            end_date: End date
-            pickup_location: Pickup location
-            drop_location: Drop location
-            total_amount: Total amount
-            advance_amount: Advance amount paid
-            payment_mode: Payment mode
-            tracking_id: Payment tracking ID
-            
-        Returns:
-            True if successful
-        """
-        subject = f"🎉 Booking Confirmed - Order #{booking_id}"
-        
-        # Format dates
-        start_date_formatted = start_date
-        end_date_formatted = end_date
-        
-        body_text = f"""
-        Dear {user_name},
-        
-        Your booking has been confirmed!
-        
-        Booking ID: {booking_id}
-        Car: {car_name}
-Registration: {registration_number or 'N/A'}
-Start Date: {start_date_formatted}
-End Date: {end_date_formatted}
-Pickup Location: {pickup_location or 'N/A'}
-Drop Location: {drop_location or 'N/A'}
-Total Amount: ₹{total_amount:,.0f}
-Advance Paid: ₹{advance_amount:,.0f}
-Payment Mode: {payment_mode or 'N/A'}
-Transaction ID: {tracking_id or 'N/A'}
-        
-        Thank you for choosing GoGoCar!
-        """
-        
-        body_html = f"""
+# Booking confirmation HTML, compiled once at import
+_BOOKING_CONFIRMATION_HTML = """\
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -179,7 +43,7 @@ Transaction ID: {tracking_id or 'N/A'}
                     <!-- Content -->
                     <tr>
                         <td style="padding: 40px 30px;">
-                            <p style="margin: 0 0 20px 0; color: #1f2937; font-size: 16px; line-height: 1.6;">Dear <strong>{user_name}</strong>,</p>
+                            <p style="margin: 0 0 20px 0; color: #1f2937; font-size: 16px; line-height: 1.6;">Dear <strong>{{ user_name }}</strong>,</p>
                             <p style="margin: 0 0 30px 0; color: #4b5563; font-size: 15px; line-height: 1.6;">Thank you for your payment! Your booking has been successfully confirmed. Here are your booking details:</p>
                             
                             <!-- Booking Details Card -->
@@ -190,7 +54,7 @@ Transaction ID: {tracking_id or 'N/A'}
                                             <tr>
                                                 <td style="padding: 8px 0;">
                                                     <span style="color: #6b7280; font-size: 13px; text-transform: uppercase; letter-spacing: 0.5px;">Booking ID</span>
-                                                    <div style="color: #1f2937; font-size: 20px; font-weight: 700; margin-top: 4px;">#{booking_id}</div>
+                                                    <div style="color: #1f2937; font-size: 20px; font-weight: 700; margin-top: 4px;">#{{ booking_id }}</div>
                                                 </td>
                                             </tr>
                                         </table>
@@ -202,38 +66,38 @@ Transaction ID: {tracking_id or 'N/A'}
                                             <tr>
                                                 <td style="padding: 12px 0; border-bottom: 1px solid #e5e7eb;">
                                                     <span style="color: #6b7280; font-size: 14px;">Car</span>
-                                                    <div style="color: #1f2937; font-size: 16px; font-weight: 600; margin-top: 4px;">{car_brand} {car_model}</div>
-                                                    {f'<div style="color: #6b7280; font-size: 13px; margin-top: 2px;">Reg: {registration_number}</div>' if registration_number else ''}
+                                                    <div style="color: #1f2937; font-size: 16px; font-weight: 600; margin-top: 4px;">{{ car_brand }} {{ car_model }}</div>
+                                                    {% if registration_number %}<div style="color: #6b7280; font-size: 13px; margin-top: 2px;">Reg: {{ registration_number }}</div>{% endif %}
                                                 </td>
                                             </tr>
                                             <tr>
                                                 <td style="padding: 12px 0; border-bottom: 1px solid #e5e7eb;">
                                                     <span style="color: #6b7280; font-size: 14px;">Pickup Date & Time</span>
-                                                    <div style="color: #1f2937; font-size: 16px; font-weight: 600; margin-top: 4px;">{start_date_formatted}</div>
-                                                    {f'<div style="color: #6b7280; font-size: 13px; margin-top: 2px;">📍 {pickup_location}</div>' if pickup_location else ''}
+                                                    <div style="color: #1f2937; font-size: 16px; font-weight: 600; margin-top: 4px;">{{ start_date }}</div>
+                                                    {% if pickup_location %}<div style="color: #6b7280; font-size: 13px; margin-top: 2px;">📍 {{ pickup_location }}</div>{% endif %}
                                                 </td>
                                             </tr>
                                             <tr>
                                                 <td style="padding: 12px 0; border-bottom: 1px solid #e5e7eb;">
                                                     <span style="color: #6b7280; font-size: 14px;">Return Date & Time</span>
-                                                    <div style="color: #1f2937; font-size: 16px; font-weight: 600; margin-top: 4px;">{end_date_formatted}</div>
-                                                    {f'<div style="color: #6b7280; font-size: 13px; margin-top: 2px;">📍 {drop_location}</div>' if drop_location else ''}
+                                                    <div style="color: #1f2937; font-size: 16px; font-weight: 600; margin-top: 4px;">{{ end_date }}</div>
+                                                    {% if drop_location %}<div style="color: #6b7280; font-size: 13px; margin-top: 2px;">📍 {{ drop_location }}</div>{% endif %}
                                                 </td>
                                             </tr>
                                             <tr>
                                                 <td style="padding: 12px 0; border-bottom: 1px solid #e5e7eb;">
                                                     <span style="color: #6b7280; font-size: 14px;">Total Amount</span>
-                                                    <div style="color: #1f2937; font-size: 20px; font-weight: 700; margin-top: 4px;">₹{total_amount:,.0f}</div>
+                                                    <div style="color: #1f2937; font-size: 20px; font-weight: 700; margin-top: 4px;">₹{{ total_amount }}</div>
                                                 </td>
                                             </tr>
                                             <tr>
                                                 <td style="padding: 12px 0; border-bottom: 1px solid #e5e7eb;">
                                                     <span style="color: #6b7280; font-size: 14px;">Advance Paid</span>
-                                                    <div style="color: #059669; font-size: 18px; font-weight: 600; margin-top: 4px;">₹{advance_amount:,.0f}</div>
+                                                    <div style="color: #059669; font-size: 18px; font-weight: 600; margin-top: 4px;">₹{{ advance_amount }}</div>
                                                 </td>
                                             </tr>
-                                            {f'<tr><td style="padding: 12px 0; border-bottom: 1px solid #e5e7eb;"><span style="color: #6b7280; font-size: 14px;">Payment Mode</span><div style="color: #1f2937; font-size: 15px; font-weight: 500; margin-top: 4px;">{payment_mode}</div></td></tr>' if payment_mode else ''}
-                                            {f'<tr><td style="padding: 12px 0;"><span style="color: #6b7280; font-size: 14px;">Transaction ID</span><div style="color: #1f2937; font-size: 14px; font-weight: 500; margin-top: 4px; font-family: monospace;">{tracking_id}</div></td></tr>' if tracking_id else ''}
+                                            {% if payment_mode %}<tr><td style="padding: 12px 0; border-bottom: 1px solid #e5e7eb;"><span style="color: #6b7280; font-size: 14px;">Payment Mode</span><div style="color: #1f2937; font-size: 15px; font-weight: 500; margin-top: 4px;">{{ payment_mode }}</div></td></tr>{% endif %}
+                                            {% if tracking_id %}<tr><td style="padding: 12px 0;"><span style="color: #6b7280; font-size: 14px;">Transaction ID</span><div style="color: #1f2937; font-size: 14px; font-weight: 500; margin-top: 4px; font-family: monospace;">{{ tracking_id }}</div></td></tr>{% endif %}
                                         </table>
                                     </td>
                                 </tr>
@@ -250,7 +114,7 @@ Transaction ID: {tracking_id or 'N/A'}
                             <table role="presentation" style="width: 100%; border-collapse: collapse; margin-bottom: 30px;">
                                 <tr>
                                     <td style="text-align: center; padding: 20px 0;">
-                                        <a href="{settings.DOMAIN_URL or 'http://localhost:8000'}/orders/view" style="display: inline-block; background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); color: #ffffff; text-decoration: none; padding: 14px 32px; border-radius: 6px; font-weight: 600; font-size: 15px;">View My Bookings</a>
+                                        <a href="{{ domain_url }}/orders/view" style="display: inline-block; background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); color: #ffffff; text-decoration: none; padding: 14px 32px; border-radius: 6px; font-weight: 600; font-size: 15px;">View My Bookings</a>
                                     </td>
                                 </tr>
                             </table>
@@ -267,7 +131,7 @@ Transaction ID: {tracking_id or 'N/A'}
                     <!-- Footer -->
                     <tr>
                         <td style="background-color: #f9fafb; padding: 30px; text-align: center; border-top: 1px solid #e5e7eb;">
-                            <p style="margin: 0 0 10px 0; color: #6b7280; font-size: 13px;">© {datetime.now().year} GoGoCar. All rights reserved.</p>
+                            <p style="margin: 0 0 10px 0; color: #6b7280; font-size: 13px;">© {{ year }} GoGoCar. All rights reserved.</p>
                             <p style="margin: 0; color: #9ca3af; font-size: 12px;">This is an automated email. Please do not reply.</p>
                         </td>
                     </tr>
@@ -275,12 +139,356 @@ Transaction ID: {tracking_id or 'N/A'}
             </td>
         </tr>
     </table>
-        </body>
-        </html>
+</body>
+</html>
+"""
+
+_BOOKING_CONFIRMATION_TMPL = Environment(autoescape=True).from_string(_BOOKING_CONFIRMATION_HTML)
+
+@lru_cache(maxsize=1)
+def _year_for_day(day: int) -> int:
+    """Calendar year, recomputed only when the (UTC) day number changes"""
+    return datetime.now().year
+
+
+def _current_year() -> int:
+    """Copyright year for email footers"""
+    return _year_for_day(int(time.time()) // 86400)
+
+
+# Booking confirmation plain-text body, filled with %-formatting
+_BOOKING_CONFIRMATION_TEXT = """\
+Dear %(user_name)s,
+
+Your booking has been confirmed!
+
+Booking ID: %(booking_id)s
+Car: %(car_name)s
+Registration: %(registration_number)s
+Start Date: %(start_date)s
+End Date: %(end_date)s
+Pickup Location: %(pickup_location)s
+Drop Location: %(drop_location)s
+Total Amount: ₹%(total_amount)s
+Advance Paid: ₹%(advance_amount)s
+Payment Mode: %(payment_mode)s
+Transaction ID: %(tracking_id)s
+
+Thank you for choosing GoGoCar!
+"""
+
+# Background pool so SES round trips stay off the request path
+_email_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ses')
+
+
+def _log_email_result(name: str) -> Callable[[Future], None]:
+    """Build a done-callback that logs an exception raised by a queued email job"""
+    def callback(future: Future) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Error in background email {name}: {str(exc)}")
+    return callback
+
+# SES stored template for booking confirmations (Handlebars syntax)
+BOOKING_CONFIRMED_TEMPLATE = "BookingConfirmed"
+
+_BOOKING_CONFIRMATION_TEXT_SES = """\
+Dear {{user_name}},
+
+Your booking has been confirmed!
+
+Booking ID: {{booking_id}}
+Car: {{car_name}}
+Registration: {{#if registration_number}}{{registration_number}}{{else}}N/A{{/if}}
+Start Date: {{start_date}}
+End Date: {{end_date}}
+Pickup Location: {{#if pickup_location}}{{pickup_location}}{{else}}N/A{{/if}}
+Drop Location: {{#if drop_location}}{{drop_location}}{{else}}N/A{{/if}}
+Total Amount: ₹{{total_amount}}
+Advance Paid: ₹{{advance_amount}}
+Payment Mode: {{#if payment_mode}}{{payment_mode}}{{else}}N/A{{/if}}
+Transaction ID: {{#if tracking_id}}{{tracking_id}}{{else}}N/A{{/if}}
+
+Thank you for choosing GoGoCar!
+"""
+
+
+KYC_APPROVED_TEMPLATE = "KycApproved"
+
+# SES accepts at most 50 destinations per SendBulkTemplatedEmail call
+_SES_BULK_MAX_DESTINATIONS = 50
+
+
+def _jinja_to_handlebars(source: str) -> str:
+    """Convert the simple {% if x %}...{% endif %} blocks used above to Handlebars"""
+    source = re.sub(r"\{%\s*if\s+(\w+)\s*%\}", r"{{#if \1}}", source)
+    return re.sub(r"\{%\s*endif\s*%\}", "{{/if}}", source)
+
+
+def booking_confirmation_ses_template() -> Dict:
+    """
+    Build the SES template definition for booking confirmations
+    
+    The HTML part is derived from the Jinja template so both paths render
+    the same email.
+    
+    Returns:
+        Template dict for ses_client.create_template / update_template
+    """
+    return {
+        'TemplateName': BOOKING_CONFIRMED_TEMPLATE,
+        'SubjectPart': '🎉 Booking Confirmed - Order #{{booking_id}}',
+        'HtmlPart': _jinja_to_handlebars(_BOOKING_CONFIRMATION_HTML),
+        'TextPart': _BOOKING_CONFIRMATION_TEXT_SES
+    }
+
+
+def kyc_approved_ses_template() -> Dict:
+    """
+    Build the SES template definition for KYC approval emails
+    
+    Returns:
+        Template dict for ses_client.create_template / update_template
+    """
+    return {
+        'TemplateName': KYC_APPROVED_TEMPLATE,
+        'SubjectPart': 'KYC Verification Approved',
+        'HtmlPart': '<p>Dear {{user_name}},</p><p>Your KYC documents have been approved. You can now book cars!</p>',
+        'TextPart': 'Dear {{user_name}}, your KYC documents have been approved. You can now book cars!'
+    }
+
+
+class EmailService:
+    """Service for sending emails via AWS SES"""
+    
+    def __init__(self):
+        self.ses_client = boto3.client(
+            'ses',
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.SES_REGION
+        )
+        self.from_email = settings.SES_FROM_EMAIL
+        self.from_name = settings.SES_FROM_NAME
+    
+    def _build_send_email_args(
+        self,
+        to_email: str,
+        subject: str,
+        body_text: str,
+        body_html: Optional[str] = None,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build the keyword arguments for an SES SendEmail call"""
+        destination = {
+            'ToAddresses': [to_email]
+        }
+        
+        if cc:
+            destination['CcAddresses'] = cc
+        if bcc:
+            destination['BccAddresses'] = bcc
+        
+        message = {
+            'Subject': {'Data': subject, 'Charset': 'UTF-8'}
+        }
+        
+        body = {
+            'Text': {'Data': body_text, 'Charset': 'UTF-8'}
+        }
+        
+        if body_html:
+            body['Html'] = {'Data': body_html, 'Charset': 'UTF-8'}
+        
+        message['Body'] = body
+        
+        return {
+            'Source': f"{self.from_name} <{self.from_email}>",
+            'Destination': destination,
+            'Message': message
+        }
+    
+    def send_email(
+        self,
+        to_email: str,
+        subject: str,
+        body_text: str,
+        body_html: Optional[str] = None,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Send an email via AWS SES
+        
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body_text: Plain text body
+            body_html: HTML body (optional)
+            cc: CC recipients (optional)
+            bcc: BCC recipients (optional)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            response = self.ses_client.send_email(
+                **self._build_send_email_args(to_email, subject, body_text, body_html, cc, bcc)
+            )
+            
+            logger.info(f"Email sent successfully to {to_email}. MessageId: {response['MessageId']}")
+            return True
+            
+        except ClientError as e:
+            logger.error(f"Error sending email: {str(e)}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error sending email: {str(e)}")
+            return False
+    
+    def send_email_async(self, *args: Any, **kwargs: Any) -> Future:
+        """
+        Queue send_email on the background email pool
+        
+        Takes the same arguments as send_email.
+        
+        Returns:
+            Future resolving to send_email's result
+        """
+        future = _email_executor.submit(self.send_email, *args, **kwargs)
+        future.add_done_callback(_log_email_result('send_email'))
+        return future
+    
+    def send_templated_email(
+        self,
+        to_email: str,
+        template_name: str,
+        template_data: Dict
+    ) -> bool:
+        """
+        Send an email rendered by SES from a stored template
+        
+        Args:
+            to_email: Recipient email address
+            template_name: Name of the SES template
+            template_data: Values substituted into the template
+            
+        Returns:
+            True if successful, False otherwise
         """
+        try:
+            response = self.ses_client.send_templated_email(
+                Source=f"{self.from_name} <{self.from_email}>",
+                Destination={'ToAddresses': [to_email]},
+                Template=template_name,
+                TemplateData=orjson.dumps(template_data).decode()
+            )
+            
+            logger.info(f"Templated email sent successfully to {to_email}. MessageId: {response['MessageId']}")
+            return True
+            
+        except ClientError as e:
+            logger.error(f"Error sending templated email: {str(e)}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error sending templated email: {str(e)}")
+            return False
+    
+    def send_booking_confirmation(
+        self,
+        to_email: str,
+        user_name: str,
+        booking_id: str,
+        car_name: str,
+        car_brand: str,
+        car_model: str,
+        registration_number: Optional[str],
+        start_date: str,
+        end_date: str,
+        pickup_location: Optional[str],
+        drop_location: Optional[str],
+        total_amount: float,
+        advance_amount: float,
+        payment_mode: Optional[str] = None,
+        tracking_id: Optional[str] = None
+    ) -> bool:
+        """
+        Send booking confirmation email with beautiful HTML template
+        
+        Args:
+            to_email: Recipient email
+            user_name: User's name
+            booking_id: Booking ID
+            car_name: Car name
+            car_brand: Car brand
+            car_model: Car model
+            registration_number: Car registration number
+            start_date: Start date
+            end_date: End date
+            pickup_location: Pickup location
+            drop_location: Drop location
+            total_amount: Total amount
+            advance_amount: Advance amount paid
+            payment_mode: Payment mode
+            tracking_id: Payment tracking ID
+            
+        Returns:
+            True if successful
+        """
+        subject = f"🎉 Booking Confirmed - Order #{booking_id}"
+        
+        # One context shared by the SES template, the text body and the HTML body
+        context = {
+            'user_name': user_name,
+            'booking_id': booking_id,
+            'car_name': car_name,
+            'car_brand': car_brand,
+            'car_model': car_model,
+            'registration_number': registration_number,
+            'start_date': start_date,
+            'end_date': end_date,
+            'pickup_location': pickup_location,
+            'drop_location': drop_location,
+            'total_amount': f"{total_amount:,.0f}",
+            'advance_amount': f"{advance_amount:,.0f}",
+            'payment_mode': payment_mode,
+            'tracking_id': tracking_id,
+            'domain_url': settings.DOMAIN_URL or 'http://localhost:8000',
+            'year': _current_year()
+        }
+        
+        if settings.SES_USE_TEMPLATES:
+            # SES renders the stored template; only the values go over the wire
+            return self.send_templated_email(to_email, BOOKING_CONFIRMED_TEMPLATE, context)
+        
+        body_text = _BOOKING_CONFIRMATION_TEXT % dict(
+            context,
+            registration_number=registration_number or 'N/A',
+            pickup_location=pickup_location or 'N/A',
+            drop_location=drop_location or 'N/A',
+            payment_mode=payment_mode or 'N/A',
+            tracking_id=tracking_id or 'N/A'
+        )
+        body_html = _BOOKING_CONFIRMATION_TMPL.render(context)
         
         return self.send_email(to_email, subject, body_text, body_html)
     
+    def send_booking_confirmation_async(self, **kwargs: Any) -> Future:
+        """
+        Queue send_booking_confirmation on the background email pool
+        
+        Takes the same arguments as send_booking_confirmation.
+        
+        Returns:
+            Future resolving to send_booking_confirmation's result
+        """
+        future = _email_executor.submit(self.send_booking_confirmation, **kwargs)
+        future.add_done_callback(_log_email_result('send_booking_confirmation'))
+        return future
+    
     def send_kyc_approval(
         self,
         to_email: str,
@@ -292,6 +500,44 @@ Transaction ID: {tracking_id or 'N/A'}
         body_html = f"<p>Dear {user_name},</p><p>Your KYC documents have been approved. You can now book cars!</p>"
         return self.send_email(to_email, subject, body_text, body_html)
     
+    def send_bulk_kyc_approval(
+        self,
+        recipients: List[Tuple[str, str]]
+    ) -> int:
+        """
+        Send KYC approval emails to many users with SendBulkTemplatedEmail
+        
+        Args:
+            recipients: List of (email, user_name) tuples
+            
+        Returns:
+            Number of emails SES accepted
+        """
+        sent = 0
+        for start in range(0, len(recipients), _SES_BULK_MAX_DESTINATIONS):
+            batch = recipients[start:start + _SES_BULK_MAX_DESTINATIONS]
+            try:
+                response = self.ses_client.send_bulk_templated_email(
+                    Source=f"{self.from_name} <{self.from_email}>",
+                    Template=KYC_APPROVED_TEMPLATE,
+                    DefaultTemplateData=orjson.dumps({'user_name': ''}).decode(),
+                    Destinations=[
+                        {
+                            'Destination': {'ToAddresses': [email]},
+                            'ReplacementTemplateData': orjson.dumps({'user_name': name}).decode()
+                        }
+                        for email, name in batch
+                    ]
+                )
+                sent += sum(1 for status in response.get('Status', []) if status.get('Status') == 'Success')
+            except ClientError as e:
+                logger.error(f"Error sending bulk KYC approval emails: {str(e)}")
+            except Exception as e:
+                logger.error(f"Unexpected error sending bulk KYC approval emails: {str(e)}")
+        
+        logger.info(f"Bulk KYC approval emails sent: {sent}/{len(recipients)}")
+        return sent
+    
     def send_kyc_rejection(
         self,
         to_email: str,
@@ -4,7 +4,9 @@ Kept for backward compatibility
 """
 from typing import Optional
 from pathlib import Path
+import asyncio
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from app.core.config import settings
 from app.core.logging_config import logger
@@ -12,6 +14,28 @@ from app.core.logging_config import logger
 # Import new S3 service for reuse
 from app.utils.s3_service import s3_service
 
+# Shared S3 client (boto3 clients are thread-safe once constructed)
+_s3_client = boto3.client(
+    's3',
+    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+    region_name=settings.AWS_REGION
+)
+
+# KYC docs and images are small: skip multipart and the transfer thread pool
+_XFER_CFG = TransferConfig(multipart_threshold=64 * 1024 * 1024, use_threads=False, max_concurrency=1)
+_SINGLE_PUT_MAX_SIZE = 5 * 1024 * 1024
+
+
+def _resolve_upload_path(filepath: str) -> Path:
+    """Resolve a relative upload path against the project root"""
+    file_path = Path(filepath)
+    if not file_path.is_absolute():
+        # If relative, make it relative to project root
+        project_root = Path(__file__).parent.parent.parent.parent
+        file_path = project_root / filepath
+    return file_path
+
 
 def upload_file_to_s3(
     filepath: str,
@@ -30,24 +54,17 @@ def upload_file_to_s3(
         S3 URL of uploaded file
     """
     try:
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION
-        )
-        
         # Resolve filepath (handle relative paths)
-        file_path = Path(filepath)
-        if not file_path.is_absolute():
-            # If relative, make it relative to project root
-            project_root = Path(__file__).parent.parent.parent.parent
-            file_path = project_root / filepath
+        file_path = _resolve_upload_path(filepath)
         
         if object_name is None:
             object_name = file_path.name
         
-        s3_client.upload_file(str(file_path), bucket_name, object_name)
+        if file_path.stat().st_size < _SINGLE_PUT_MAX_SIZE:
+            with open(file_path, 'rb') as f:
+                _s3_client.put_object(Bucket=bucket_name, Key=object_name, Body=f)
+        else:
+            _s3_client.upload_file(str(file_path), bucket_name, object_name, Config=_XFER_CFG)
         
         # Generate URL
         url = f"https://{bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{object_name}"
@@ -62,3 +79,22 @@ def upload_file_to_s3(
         logger.error(f"Unexpected error uploading file: {str(e)}")
         raise
 
+
+async def upload_file_to_s3_async(
+    filepath: str,
+    bucket_name: str,
+    object_name: Optional[str] = None
+) -> str:
+    """
+    Upload a file to S3 bucket without blocking the event loop
+    
+    Args:
+        filepath: Local file path (relative or absolute)
+        bucket_name: S3 bucket name
+        object_name: S3 object name (optional)
+        
+    Returns:
+        S3 URL of uploaded file
+    """
+    # The file read and the PUT both happen in a worker thread on the shared client
+    return await asyncio.to_thread(upload_file_to_s3, filepath, bucket_name, object_name)
@@ -1,49 +1,177 @@
 """
 Pagination utilities for list endpoints
 """
-from typing import Generic, TypeVar, List, Optional
-from pydantic import BaseModel, ConfigDict
+from typing import Any, Generic, Iterable, TypeVar, List, Optional, Sequence
+from pydantic import BaseModel, ConfigDict, model_validator
+from sqlalchemy import func, inspect
 from sqlalchemy.orm import Query
 from math import ceil
+from collections import deque
+from itertools import islice
+import base64
+import hashlib
+import json
+import threading
+from cachetools import TTLCache
 
 from app.core.config import settings
 
 T = TypeVar('T')
 
+# Short-lived COUNT results keyed by a hash of the filtered statement
+_count_cache: TTLCache = TTLCache(maxsize=1024, ttl=max(1, settings.PAGINATION_COUNT_CACHE_TTL))
+_count_cache_lock = threading.Lock()
+
+
+def _clamp_pagination(page: int, page_size: int) -> tuple[int, int]:
+    """Clamp page to >= 1 and page_size to 1..MAX_PAGE_SIZE (invalid sizes use the default)"""
+    if page_size < 1:
+        page_size = settings.DEFAULT_PAGE_SIZE
+    return max(1, page), min(page_size, settings.MAX_PAGE_SIZE)
+
 
 class PaginationParams(BaseModel):
     """Pagination parameters"""
     page: int = 1
     page_size: int = settings.DEFAULT_PAGE_SIZE
     
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Validate and clamp page_size
-        if self.page_size > settings.MAX_PAGE_SIZE:
-            self.page_size = settings.MAX_PAGE_SIZE
-        if self.page_size < 1:
-            self.page_size = settings.DEFAULT_PAGE_SIZE
-        if self.page < 1:
-            self.page = 1
+    @model_validator(mode='after')
+    def clamp(self) -> 'PaginationParams':
+        """Clamp page and page_size into the allowed range"""
+        self.page, self.page_size = _clamp_pagination(self.page, self.page_size)
+        return self
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response model"""
     items: List[T]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_next: bool
+    has_prev: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class KeysetPaginatedResponse(BaseModel, Generic[T]):
+    """Keyset (cursor) paginated response model"""
+    items: List[T]
+    page_size: int
+    next_cursor: Optional[str] = None
     has_next: bool
     has_prev: bool
 
     model_config = ConfigDict(from_attributes=True)
 
 
+def encode_cursor(value: Any) -> str:
+    """
+    Encode a keyset value as an opaque URL-safe cursor token
+    
+    Args:
+        value: JSON-serializable value of the ordering column
+        
+    Returns:
+        Cursor token
+    """
+    return base64.urlsafe_b64encode(json.dumps(value).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Any:
+    """
+    Decode a cursor token produced by encode_cursor
+    
+    Args:
+        cursor: Cursor token
+        
+    Returns:
+        Keyset value
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def count_query(query: Query) -> int:
+    """
+    Count the rows a query would return
+    
+    ORDER BY, loader options and selected columns are dropped so the database can
+    answer with a direct aggregate instead of counting a materialized subquery.
+    Queries with DISTINCT/GROUP BY/HAVING/LIMIT/OFFSET or several entities keep
+    the subquery count, since their row count depends on it.
+    
+    Args:
+        query: SQLAlchemy query object
+        
+    Returns:
+        Total number of rows
+    """
+    entities = query.column_descriptions
+    if (
+        len(entities) != 1
+        or entities[0]['entity'] is None
+        or query._distinct
+        or query._group_by_clauses
+        or query._having_criteria
+        or query._limit_clause is not None
+        or query._offset_clause is not None
+    ):
+        return query.count()
+    
+    pk = inspect(entities[0]['entity']).primary_key[0]
+    return query.order_by(None).enable_eagerloads(False).with_entities(func.count(pk)).scalar() or 0
+
+
+def _count_cache_key(query: Query) -> str:
+    """Hash of the query's SQL and bound parameters, ignoring ORDER BY/LIMIT/OFFSET"""
+    compiled = query.order_by(None).limit(None).offset(None).statement.compile()
+    raw = f"{compiled}|{sorted(compiled.params.items())!r}"
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def cached_count(query: Query) -> int:
+    """
+    count_query() with a short TTL cache for large results
+    
+    Counts below PAGINATION_COUNT_CACHE_MIN_ROWS are cheap and are not cached,
+    so small listings always show fresh totals.
+    
+    Args:
+        query: SQLAlchemy query object
+        
+    Returns:
+        Total number of rows
+    """
+    if settings.PAGINATION_COUNT_CACHE_TTL <= 0:
+        return count_query(query)
+    
+    key = _count_cache_key(query)
+    with _count_cache_lock:
+        total = _count_cache.get(key)
+    if total is not None:
+        return total
+    
+    total = count_query(query)
+    if total >= settings.PAGINATION_COUNT_CACHE_MIN_ROWS:
+        with _count_cache_lock:
+            _count_cache[key] = total
+    return total
+
+
 def paginate_query(
     query: Query,
     page: int = 1,
-    page_size: int = settings.DEFAULT_PAGE_SIZE
+    page_size: int = settings.DEFAULT_PAGE_SIZE,
+    skip_total: Optional[bool] = None,
+    *,
+    eager: Sequence = ()
 ) -> tuple[List, PaginatedResponse]:
     """
     Paginate a SQLAlchemy query
@@ -52,27 +180,46 @@ def paginate_query(
         query: SQLAlchemy query object
         page: Page number (1-indexed)
         page_size: Number of items per page
+        skip_total: Skip the COUNT query and leave total/total_pages as None
+            (defaults to settings.PAGINATION_SKIP_TOTAL)
+        eager: Loader options applied to the page fetch only (not the COUNT),
+            e.g. eager=[joinedload(Orders.car)], to avoid N+1 lazy loads
+            when iterating the items
         
     Returns:
         Tuple of (items, pagination_info)
     """
     # Validate pagination params
-    if page_size > settings.MAX_PAGE_SIZE:
-        page_size = settings.MAX_PAGE_SIZE
-    if page_size < 1:
-        page_size = settings.DEFAULT_PAGE_SIZE
-    if page < 1:
-        page = 1
+    page, page_size = _clamp_pagination(page, page_size)
+    if skip_total is None:
+        skip_total = settings.PAGINATION_SKIP_TOTAL
+    
+    offset = (page - 1) * page_size
+    page_query = query.options(*eager) if eager else query
+    
+    if skip_total:
+        # Fetch one extra row to learn whether another page exists, no COUNT needed
+        rows = page_query.offset(offset).limit(page_size + 1).all()
+        items = rows[:page_size]
+        
+        pagination = PaginatedResponse(
+            items=items,
+            page=page,
+            page_size=page_size,
+            has_next=len(rows) > page_size,
+            has_prev=page > 1
+        )
+        
+        return items, pagination
     
-    # Get total count
-    total = query.count()
+    # Get total count (large counts are reused for a short TTL)
+    total = cached_count(query)
     
     # Calculate pagination
     total_pages = ceil(total / page_size) if total > 0 else 0
-    offset = (page - 1) * page_size
     
     # Get items
-    items = query.offset(offset).limit(page_size).all()
+    items = page_query.offset(offset).limit(page_size).all()
     
     # Build pagination response
     pagination = PaginatedResponse(
@@ -88,35 +235,126 @@ def paginate_query(
     return items, pagination
 
 
+def paginate_query_keyset(
+    query: Query,
+    order_col,
+    cursor: Optional[str] = None,
+    page_size: int = settings.DEFAULT_PAGE_SIZE,
+    descending: bool = False
+) -> tuple[List, KeysetPaginatedResponse]:
+    """
+    Paginate a SQLAlchemy query by keyset instead of OFFSET
+    
+    Each page seeks past the last seen value of order_col, so the cost per page
+    stays constant however deep the client pages. order_col must be unique
+    (typically the primary key) and is used as the only sort key.
+    
+    Args:
+        query: SQLAlchemy query object
+        order_col: Unique column to order and seek on (e.g. Cars.id)
+        cursor: Token from the previous page's next_cursor (None for the first page)
+        page_size: Number of items per page
+        descending: Walk order_col from highest to lowest
+        
+    Returns:
+        Tuple of (items, pagination_info)
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    # Validate pagination params
+    _, page_size = _clamp_pagination(1, page_size)
+    
+    query = query.order_by(None).order_by(order_col.desc() if descending else order_col.asc())
+    if cursor:
+        last_value = decode_cursor(cursor)
+        query = query.filter(order_col < last_value if descending else order_col > last_value)
+    
+    # Fetch one extra row to learn whether another page exists
+    items = query.limit(page_size + 1).all()
+    has_next = len(items) > page_size
+    items = items[:page_size]
+    
+    next_cursor = None
+    if has_next:
+        next_cursor = encode_cursor(getattr(items[-1], order_col.key))
+    
+    pagination = KeysetPaginatedResponse(
+        items=items,
+        page_size=page_size,
+        next_cursor=next_cursor,
+        has_next=has_next,
+        has_prev=cursor is not None
+    )
+    
+    return items, pagination
+
+
 def paginate_list(
-    items: List[T],
+    items: Iterable[T],
     page: int = 1,
-    page_size: int = settings.DEFAULT_PAGE_SIZE
+    page_size: int = settings.DEFAULT_PAGE_SIZE,
+    skip_total: Optional[bool] = None
 ) -> PaginatedResponse[T]:
     """
-    Paginate a list of items
+    Paginate a list or any other iterable of items
+    
+    Sequences are sliced directly; other iterables (e.g. generators) are
+    consumed lazily with islice, only as far as the page (plus the rest of
+    the stream when a total is needed).
     
     Args:
-        items: List of items
+        items: List or iterable of items
         page: Page number (1-indexed)
         page_size: Number of items per page
+        skip_total: Skip counting and leave total/total_pages as None
+            (defaults to settings.PAGINATION_SKIP_TOTAL)
         
     Returns:
         PaginatedResponse
     """
     # Validate pagination params
-    if page_size > settings.MAX_PAGE_SIZE:
-        page_size = settings.MAX_PAGE_SIZE
-    if page_size < 1:
-        page_size = settings.DEFAULT_PAGE_SIZE
-    if page < 1:
-        page = 1
+    page, page_size = _clamp_pagination(page, page_size)
+    if skip_total is None:
+        skip_total = settings.PAGINATION_SKIP_TOTAL
     
-    total = len(items)
-    total_pages = ceil(total / page_size) if total > 0 else 0
     offset = (page - 1) * page_size
+    total = None
+    
+    if isinstance(items, Sequence):
+        if skip_total:
+            window = items[offset:offset + page_size + 1]
+            has_next = len(window) > page_size
+            paginated_items = list(window[:page_size])
+        else:
+            total = len(items)
+            paginated_items = list(items[offset:offset + page_size])
+    else:
+        numbered = enumerate(items, 1)
+        skipped = deque(islice(numbered, offset), maxlen=1)
+        paginated_items = [item for _, item in islice(numbered, page_size)]
+        if skip_total:
+            has_next = next(numbered, None) is not None
+        else:
+            # Drain the rest, keeping only the last position seen
+            tail = deque(numbered, maxlen=1)
+            if tail:
+                total = tail[0][0]
+            elif paginated_items:
+                total = offset + len(paginated_items)
+            else:
+                total = skipped[0][0] if skipped else 0
     
-    paginated_items = items[offset:offset + page_size]
+    if total is None:
+        return PaginatedResponse(
+            items=paginated_items,
+            page=page,
+            page_size=page_size,
+            has_next=has_next,
+            has_prev=page > 1
+        )
+    
+    total_pages = ceil(total / page_size) if total > 0 else 0
     
     return PaginatedResponse(
         items=paginated_items,
@@ -127,4 +365,3 @@ def paginate_list(
         has_next=page < total_pages,
         has_prev=page > 1
     )
-
@@ -2,10 +2,48 @@
 Price calculation utilities
 """
 from typing import Dict, Any, Optional, Tuple
+from bisect import bisect_right
+from functools import lru_cache
 from app.db.models import Cars
 from app.core.logging_config import logger
 
 
+@lru_cache(maxsize=1024)
+def _parse_prices(prices_items: Tuple[Tuple[str, Any], ...]) -> Tuple[Tuple[int, ...], Tuple[Tuple[int, int, Any], ...]]:
+    """
+    Parse a car's "start-end" day-range prices into sorted ranges
+    
+    Args:
+        prices_items: Tuple of (day_range, day_price) pairs from car.prices
+        
+    Returns:
+        Tuple of (range starts, (start, end, price) ranges), both sorted by start
+    """
+    ranges = []
+    for day_range, day_price in prices_items:
+        # Skip non-range entries such as "deposit"
+        if '-' not in day_range:
+            continue
+        starting_day, ending_day = day_range.split('-')
+        ranges.append((int(starting_day), int(ending_day), day_price))
+    ranges.sort(key=lambda r: r[0])
+    return tuple(r[0] for r in ranges), tuple(ranges)
+
+
+def _to_paise(amount: Any) -> int:
+    """Convert a rupee amount to integer paise"""
+    return int(round(float(amount) * 100))
+
+
+def _price_for_days(prices: Dict[str, Any], days: int, default: Any) -> Any:
+    """Look up the day-range price covering days, falling back to default"""
+    starts, ranges = _parse_prices(tuple(prices.items()))
+    i = bisect_right(starts, days) - 1
+    if i >= 0 and days <= ranges[i][1]:
+        return ranges[i][2]
+    return default
+
+
 def calculate_price(
     days: int, 
     hours: int, 
@@ -28,38 +66,36 @@ def calculate_price(
         # Get price based on days
         price = car.base_price
         if car.prices:
-            for day_range, day_price in car.prices.items():
-                starting_day, ending_day = day_range.split('-')
-                starting_day = int(starting_day)
-                ending_day = int(ending_day)
-                if starting_day <= days <= ending_day:
-                    price = day_price
-                    break
+            price = _price_for_days(car.prices, days, price)
         
         price = int(price)
         
-        # Calculate total price for days and hours
-        total_amount = days * price + (price / 24) * hours
-        total_amount = round(total_amount, 2)
+        # Work in integer paise and convert back once at the end
+        price_paise = price * 100
+        
+        # Days plus pro-rated hours (hourly rate = price / 24), rounded half-up to the paisa
+        total_paise = days * price_paise + (price_paise * hours * 2 + 24) // 48
         
         # Add protection price
-        total_amount = total_amount + car.protection_price
+        total_paise += _to_paise(car.protection_price)
         
         # Apply discount if provided
-        discount_applied = 0.0
+        discount_paise = 0
         if discount_amount:
-            discount_applied = min(discount_amount, total_amount)  # Don't exceed total
-            total_amount = total_amount - discount_applied
-            total_amount = max(0, round(total_amount, 2))  # Ensure non-negative
+            discount_paise = min(_to_paise(discount_amount), total_paise)  # Don't exceed total
+            total_paise -= discount_paise
         
         # Calculate 30% of the discounted total amount as advance_amount
-        advance_amount = round(total_amount * 0.3, 2)
-        pay_at_car = total_amount - advance_amount
+        advance_paise = (total_paise * 30 + 50) // 100
+        
+        total_amount = total_paise / 100
+        advance_amount = advance_paise / 100
+        pay_at_car = (total_paise - advance_paise) / 100
+        discount_applied = discount_paise / 100
         
         logger.info(
-            f"Price calculated: days={days}, hours={hours}, "
-            f"total={total_amount}, advance={advance_amount}, pay_at_car={pay_at_car}, "
-            f"discount={discount_applied}"
+            "Price calculated: days=%s, hours=%s, total=%s, advance=%s, pay_at_car=%s, discount=%s",
+            days, hours, total_amount, advance_amount, pay_at_car, discount_applied
         )
         
         return total_amount, advance_amount, pay_at_car, discount_applied
@@ -1,18 +1,35 @@
 """
 S3 service for file uploads and management
 """
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from pathlib import Path
+import asyncio
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from fastapi import UploadFile
-import uuid
+import hashlib
 import os
+import uuid
+import shutil
 from datetime import datetime
 
 from app.core.config import settings
 from app.core.logging_config import logger
 
+# Pooled keep-alive connections so concurrent uploads reuse TLS sessions
+_S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    signature_version='s3v4',
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+)
+
+# Public image folders: content-addressed objects here are deduplicated with
+# HeadObject and served with a long-lived cache header. Private uploads (KYC,
+# maintenance, damage photos) get neither.
+_PUBLIC_IMAGE_PREFIXES = ('cars/',)
+
 class S3Service:
     def __init__(self):
         self.aws_access_key = settings.AWS_ACCESS_KEY_ID
@@ -32,7 +49,8 @@ class S3Service:
                     's3',
                     aws_access_key_id=self.aws_access_key,
                     aws_secret_access_key=self.aws_secret_key,
-                    region_name=self.region
+                    region_name=self.region,
+                    config=_S3_CLIENT_CONFIG
                 )
             except Exception as e:
                 logger.error(f"Failed to initialize S3 client: {str(e)}. Falling back to local storage.")
@@ -43,6 +61,49 @@ class S3Service:
             os.makedirs("static/uploads/kyc", exist_ok=True)
             os.makedirs("static/uploads/cars", exist_ok=True)
     
+    @staticmethod
+    def _save_local(fileobj, local_path: Path) -> None:
+        """Copy an upload stream to local storage"""
+        with open(local_path, "wb") as f:
+            shutil.copyfileobj(fileobj, f)
+    
+    @staticmethod
+    def _hash_fileobj(fileobj) -> str:
+        """Content digest of an upload stream, read in 1 MB chunks"""
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: fileobj.read(1024 * 1024), b''):
+            digest.update(chunk)
+        fileobj.seek(0)
+        return digest.hexdigest()
+    
+    def _object_exists(self, object_name: str) -> bool:
+        """
+        Check whether an object is already stored under this key
+        
+        Without s3:ListBucket, HeadObject on a missing key returns 403
+        instead of 404. Any error is treated as "not known to exist" so
+        the caller goes ahead with the PUT, which only needs s3:PutObject.
+        """
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=object_name)
+            return True
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if code not in ('404', 'NoSuchKey', 'NotFound', '403', 'AccessDenied', 'Forbidden'):
+                logger.warning("HeadObject failed for %s (%s), uploading anyway", object_name, code)
+            return False
+    
+    def object_exists(self, object_name: str) -> bool:
+        """
+        Check that an object was actually stored in S3 under this key
+        
+        Unlike the upload dedup check, an unknown answer (e.g. 403) counts as
+        missing. Always False when local storage is in use.
+        """
+        if self.use_local_storage:
+            return False
+        return self._object_exists(object_name)
+    
     async def upload_file(
         self,
         file: UploadFile,
@@ -61,47 +122,58 @@ class S3Service:
             S3 URL of uploaded file
         """
         try:
-            # Generate unique object name if not provided
-            if not object_name:
+            # Rewind and stream from the underlying spooled file instead of reading it into memory
+            await file.seek(0)
+            
+            # Name by content hash if not provided, so re-uploads of the same file reuse one object
+            content_addressed = not object_name
+            if content_addressed:
                 file_extension = Path(file.filename).suffix if file.filename else '.bin'
-                object_name = f"{folder}/{uuid.uuid4().hex}{file_extension}"
+                digest = await asyncio.to_thread(self._hash_fileobj, file.file)
+                object_name = f"{folder}/{digest}{file_extension}"
             
             # Ensure folder prefix
             if not object_name.startswith(folder):
                 object_name = f"{folder}/{object_name}"
             
-            # Reset file pointer
-            await file.seek(0)
-            file_content = await file.read()
-            await file.seek(0)
-            
             if self.use_local_storage:
                 # Save locally to static/uploads
                 local_path = Path("static/uploads") / object_name
                 local_path.parent.mkdir(parents=True, exist_ok=True)
                 
-                with open(local_path, "wb") as f:
-                    f.write(file_content)
+                if not (content_addressed and local_path.exists()):
+                    await asyncio.to_thread(self._save_local, file.file, local_path)
+                    await file.seek(0)
                 
                 # Return local URL (assuming domain is handled or relative works)
                 url = f"/static/uploads/{object_name}"
-                logger.info(f"File saved locally: {url}")
+                logger.info("File saved locally: %s", url)
                 return url
             
-            # Upload to S3
-            from io import BytesIO
-            file_obj = BytesIO(file_content)
-            self.s3_client.upload_fileobj(
-                file_obj,
+            # Generate S3 URL
+            url = self.get_object_url(object_name)
+            
+            extra_args = {'ContentType': file.content_type}
+            if content_addressed and object_name.startswith(_PUBLIC_IMAGE_PREFIXES):
+                # Identical content is already stored; skip the PUT
+                if await asyncio.to_thread(self._object_exists, object_name):
+                    logger.info("File already in S3, skipping upload: %s", url)
+                    return url
+                # Content-addressed keys never change, so they can be cached indefinitely
+                extra_args['CacheControl'] = 'public, max-age=31536000, immutable'
+            
+            # Upload to S3 in a worker thread so the event loop keeps serving requests
+            # (upload_fileobj switches to multipart for large files)
+            await asyncio.to_thread(
+                self.s3_client.upload_fileobj,
+                file.file,
                 self.bucket_name,
                 object_name,
-                ExtraArgs={'ContentType': file.content_type}
+                ExtraArgs=extra_args
             )
+            await file.seek(0)
             
-            # Generate S3 URL
-            url = f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{object_name}"
-            
-            logger.info(f"File uploaded to S3: {url}")
+            logger.info("File uploaded to S3: %s", url)
             return url
             
         except Exception as e:
@@ -123,18 +195,72 @@ class S3Service:
         Returns:
             List of S3 URLs
         """
+        # Uploads are independent, so run them concurrently
+        results = await asyncio.gather(
+            *(self.upload_file(file, folder) for file in files),
+            return_exceptions=True
+        )
+        
         urls = []
-        for file in files:
-            try:
-                url = await self.upload_file(file, folder)
-                urls.append(url)
-            except Exception as e:
-                logger.error(f"Error uploading file {file.filename}: {str(e)}")
+        for file, result in zip(files, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error uploading file {file.filename}: {str(result)}")
                 # Continue with other files
                 continue
+            urls.append(result)
         return urls
     
-    def delete_file(self, object_name: str) -> bool:
+    def generate_presigned_post(
+        self,
+        folder: str,
+        content_type: str,
+        file_extension: str = '.bin',
+        max_size: int = settings.MAX_UPLOAD_SIZE,
+        expires_in: int = 300
+    ) -> Dict[str, Any]:
+        """
+        Generate a presigned POST so the client uploads straight to S3
+        
+        The browser POSTs the file with the returned fields to the returned url;
+        the API only sees the final object key (returned here as "key").
+        
+        Args:
+            folder: S3 folder/prefix
+            content_type: Content-Type the upload must declare
+            file_extension: Extension for the generated object name
+            max_size: Maximum upload size in bytes
+            expires_in: Seconds the presigned POST stays valid
+            
+        Returns:
+            Dict with "url", "fields" and "key"
+        """
+        if self.use_local_storage:
+            raise RuntimeError("Presigned uploads require S3; local storage is in use")
+        
+        object_name = f"{folder}/{uuid.uuid4().hex}{file_extension}"
+        try:
+            # Signed locally; no request is made to S3
+            presigned = self.s3_client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                Fields={'Content-Type': content_type},
+                Conditions=[
+                    ['content-length-range', 1, max_size],
+                    {'Content-Type': content_type}
+                ],
+                ExpiresIn=expires_in
+            )
+            presigned['key'] = object_name
+            return presigned
+        except ClientError as e:
+            logger.error(f"Error generating presigned POST: {str(e)}")
+            raise
+    
+    def get_object_url(self, object_name: str) -> str:
+        """Public URL of an S3 object (e.g. after a presigned upload completes)"""
+        return f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{object_name}"
+    
+    async def delete_file(self, object_name: str) -> bool:
         """
         Delete a file from S3
         
@@ -145,11 +271,12 @@ class S3Service:
             True if successful, False otherwise
         """
         try:
-            self.s3_client.delete_object(
+            await asyncio.to_thread(
+                self.s3_client.delete_object,
                 Bucket=self.bucket_name,
                 Key=object_name
             )
-            logger.info(f"File deleted from S3: {object_name}")
+            logger.info("File deleted from S3: %s", object_name)
             return True
         except ClientError as e:
             logger.error(f"Error deleting file from S3: {str(e)}")
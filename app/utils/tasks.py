@@ -1,7 +1,7 @@
 """
 Background task utilities for async operations
 """
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 from functools import wraps
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -12,6 +12,39 @@ from app.core.logging_config import logger
 # Thread pool executor for background tasks
 _executor = ThreadPoolExecutor(max_workers=10)
 
+# Strong references to in-flight tasks so they are not garbage collected mid-run
+_background_tasks: set = set()
+
+# Shared event loop thread for coroutines submitted from outside any running loop
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting its thread on first use"""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            _bg_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_bg_loop.run_forever,
+                name='async-tasks',
+                daemon=True
+            ).start()
+        return _bg_loop
+
+
+def _log_task_result(name: str) -> Callable:
+    """Build a done-callback that logs a failed background task"""
+    def callback(future: Any) -> None:
+        _background_tasks.discard(future)
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Error running async background task {name}: {str(exc)}")
+    return callback
+
 
 def run_in_background(func: Callable) -> Callable:
     """
@@ -36,6 +69,10 @@ def run_async_task(func: Callable) -> Callable:
     """
     Decorator to run an async function in background
     
+    The coroutine is scheduled on the running event loop when called from
+    async code, otherwise on a shared background loop thread; the call
+    returns immediately without waiting for the result.
+    
     Usage:
         @run_async_task
         async def send_email_task(email, subject, body):
@@ -45,10 +82,14 @@ def run_async_task(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> None:
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(func(*args, **kwargs))
-            loop.close()
+            try:
+                # Inside a running loop (e.g. a request handler): schedule on it
+                future = asyncio.get_running_loop().create_task(func(*args, **kwargs))
+            except RuntimeError:
+                # No running loop in this thread: hand off to the shared background loop
+                future = asyncio.run_coroutine_threadsafe(func(*args, **kwargs), _get_background_loop())
+            _background_tasks.add(future)
+            future.add_done_callback(_log_task_result(func.__name__))
         except Exception as e:
             logger.error(f"Error running async background task {func.__name__}: {str(e)}")
     return wrapper
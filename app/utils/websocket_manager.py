@@ -1,10 +1,11 @@
 """
 WebSocket manager for real-time notifications
 """
-from typing import Dict, Set
+from typing import Set
+from weakref import WeakKeyDictionary
 from fastapi import WebSocket
-import json
 import asyncio
+import orjson
 from app.core.logging_config import logger
 
 
@@ -13,40 +14,44 @@ class ConnectionManager:
     
     def __init__(self):
         # Store active connections: {websocket: user_id}
-        self.active_connections: Dict[WebSocket, int] = {}
+        # Weak keys so a socket that is dropped without disconnect() cannot linger
+        self.active_connections: "WeakKeyDictionary[WebSocket, int]" = WeakKeyDictionary()
     
     async def connect(self, websocket: WebSocket, user_id: int):
         """Register a WebSocket connection (connection should already be accepted)"""
         self.active_connections[websocket] = user_id
-        logger.info(f"WebSocket connected: User {user_id}")
+        logger.info("WebSocket connected: User %s", user_id)
     
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection"""
         if websocket in self.active_connections:
             user_id = self.active_connections.pop(websocket)
-            logger.info(f"WebSocket disconnected: User {user_id}")
+            logger.info("WebSocket disconnected: User %s", user_id)
     
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific connection"""
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(orjson.dumps(message).decode())
         except Exception as e:
             logger.error(f"Error sending WebSocket message: {str(e)}")
             self.disconnect(websocket)
     
     async def broadcast(self, message: dict):
         """Broadcast a message to all connected admins"""
-        disconnected = []
-        for websocket in self.active_connections.keys():
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to WebSocket: {str(e)}")
-                disconnected.append(websocket)
+        # Serialize once with orjson and send to all sockets concurrently
+        payload = orjson.dumps(message).decode()
+        # Snapshot once; disconnect() below mutates the mapping
+        websockets = list(self.active_connections.keys())
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for websocket in websockets),
+            return_exceptions=True
+        )
         
         # Remove disconnected websockets
-        for ws in disconnected:
-            self.disconnect(ws)
+        for ws, result in zip(websockets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting to WebSocket: {str(result)}")
+                self.disconnect(ws)
     
     async def send_notification(self, notification_type: str, data: dict):
         """
@@ -0,0 +1,11 @@
+import sqlite3
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_conn(path='gogocar.db'):
+    """Shared read-only connection for the check_* diagnostic scripts"""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
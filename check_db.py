@@ -1,15 +1,13 @@
-import sqlite3
+from check_common import get_conn
 
 def check_db():
     try:
-        conn = sqlite3.connect('gogocar.db')
-        cursor = conn.cursor()
+        cursor = get_conn().cursor()
         cursor.execute("PRAGMA table_info(user_profiles)")
         columns = cursor.fetchall()
         print("Columns in user_profiles:")
         for col in columns:
             print(col)
-        conn.close()
     except Exception as e:
         print(f"Error: {e}")
 
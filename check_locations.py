@@ -1,9 +1,8 @@
 
-import sqlite3
+from check_common import get_conn
 
 def check_locations():
-    conn = sqlite3.connect('gogocar.db')
-    cursor = conn.cursor()
+    cursor = get_conn().cursor()
     try:
         cursor.execute("SELECT * FROM locations")
         rows = cursor.fetchall()
@@ -12,8 +11,6 @@ def check_locations():
             print(row)
     except Exception as e:
         print(f"Error: {e}")
-    finally:
-        conn.close()
 
 if __name__ == "__main__":
     check_locations()
@@ -1,9 +1,8 @@
-import sqlite3
+from check_common import get_conn
 
 def check_db_schema():
     try:
-        conn = sqlite3.connect('gogocar.db')
-        cursor = conn.cursor()
+        cursor = get_conn().cursor()
         cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='user_profiles'")
         schema = cursor.fetchone()
         if schema:
@@ -11,7 +10,6 @@ def check_db_schema():
             print(schema[0])
         else:
             print("Table user_profiles not found")
-        conn.close()
     except Exception as e:
         print(f"Error: {e}")
 
@@ -1,4 +1,10 @@
 import os
+import re
+
+# Jinja2 delimiters, matched left to right without overlap
+JINJA_TOKEN = re.compile(r'\{\{|\}\}|\{%|%\}')
+OPENERS = ('{{', '{%')
+OPENERS_FOR = {'}}': '{{', '%}': '{%'}
 
 def check_brackets(file_path):
     print("Checking: " + file_path)
@@ -10,28 +16,14 @@ def check_brackets(file_path):
     
     # Check Jinja2 tags
     stack = []
-    i = 0
-    while i < len(content):
-        if content[i:i+2] == '{{':
-            stack.append(('{{', i))
-            i += 2
-        elif content[i:i+2] == '}}':
-            if not stack or stack[-1][0] != '{{':
-                print("Unexpected }} at " + str(i))
-            else:
-                stack.pop()
-            i += 2
-        elif content[i:i+2] == '{%':
-            stack.append(('{%', i))
-            i += 2
-        elif content[i:i+2] == '%}':
-            if not stack or stack[-1][0] != '{%':
-                print("Unexpected %} at " + str(i))
-            else:
-                stack.pop()
-            i += 2
+    for match in JINJA_TOKEN.finditer(content):
+        tok, i = match.group(), match.start()
+        if tok in OPENERS:
+            stack.append((tok, i))
+        elif not stack or stack[-1][0] != OPENERS_FOR[tok]:
+            print("Unexpected " + tok + " at " + str(i))
         else:
-            i += 1
+            stack.pop()
     
     if stack:
         for tag, pos in stack:
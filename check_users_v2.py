@@ -1,15 +1,13 @@
-import sqlite3
+from check_common import get_conn
 
 def check_db():
     try:
-        conn = sqlite3.connect('gogocar.db')
-        cursor = conn.cursor()
+        cursor = get_conn().cursor()
         cursor.execute("SELECT username, email, hashed_password FROM user_profiles")
         users = cursor.fetchall()
         print("Users in database:")
         for user in users:
             print(user)
-        conn.close()
     except Exception as e:
         print(f"Error: {e}")
 
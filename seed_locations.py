@@ -1,23 +1,29 @@
 
 import sqlite3
 
+LOCATIONS = ['Madhapur (HYD)', 'Chilkalurupet']
+
 def seed_locations():
     conn = sqlite3.connect('gogocar.db')
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
     cursor = conn.cursor()
     try:
-        # Check if locations exist
-        cursor.execute("SELECT location FROM locations WHERE location IN ('Madhapur (HYD)', 'Chilkalurupet')")
-        existing = [row[0] for row in cursor.fetchall()]
-        
-        if 'Madhapur (HYD)' not in existing:
-            cursor.execute("INSERT INTO locations (location) VALUES ('Madhapur (HYD)')")
-            print("Added Madhapur (HYD)")
-        
-        if 'Chilkalurupet' not in existing:
-            cursor.execute("INSERT INTO locations (location) VALUES ('Chilkalurupet')")
-            print("Added Chilkalurupet")
-            
-        conn.commit()
+        # Single transaction; committed when the with-block exits
+        with conn:
+            # One parameterized IN lookup, then insert only the missing names (unique index guards races)
+            cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_locations_location ON locations(location)")
+            placeholders = ",".join("?" * len(LOCATIONS))
+            existing = {
+                row[0] for row in cursor.execute(
+                    f"SELECT location FROM locations WHERE location IN ({placeholders})", LOCATIONS
+                )
+            }
+            to_insert = [(name,) for name in LOCATIONS if name not in existing]
+            cursor.executemany("INSERT OR IGNORE INTO locations (location) VALUES (?)", to_insert)
+            for (name,) in to_insert:
+                print(f"Added {name}")
     except Exception as e:
         print(f"Error: {e}")
     finally:
@@ -14,6 +14,9 @@ import os
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
 from app.db.session import SessionLocal, engine
 from app.db import models
 from app.core.logging_config import logger
@@ -30,33 +33,26 @@ LOCATIONS_TO_SEED = [
 def seed_locations():
     db = SessionLocal()
     try:
-        added = 0
-        skipped = 0
-        for entry in LOCATIONS_TO_SEED:
-            existing = db.query(models.Location).filter(
-                models.Location.location == entry["location"]
-            ).first()
-
-            if existing:
-                print(f"  [SKIP]  '{entry['location']}' already exists (id={existing.id})")
-                skipped += 1
-            else:
-                loc = models.Location(
-                    location=entry["location"],
-                    maps_link=entry.get("maps_link")
-                )
-                db.add(loc)
-                print(f"  [ADD]   '{entry['location']}' added")
-                added += 1
-
+        # One INSERT ... ON CONFLICT DO NOTHING for all rows; location is unique
+        insert = pg_insert if engine.dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(models.Location).values([
+            {"location": entry["location"], "maps_link": entry.get("maps_link")}
+            for entry in LOCATIONS_TO_SEED
+        ]).on_conflict_do_nothing(index_elements=["location"])
+        # RETURNING hands back the inserted rows, so no follow-up SELECT is needed
+        inserted = db.execute(stmt.returning(
+            models.Location.id, models.Location.location, models.Location.maps_link
+        )).all()
         db.commit()
-        print(f"\nDone! Added: {added}, Skipped: {skipped}")
 
-        # Show all locations after seeding
-        all_locs = db.query(models.Location).order_by(models.Location.id).all()
-        print("\nAll locations in DB:")
-        for loc in all_locs:
-            print(f"  id={loc.id}  name='{loc.location}'  maps={loc.maps_link}")
+        inserted_names = {row.location for row in inserted}
+        for row in inserted:
+            print(f"  [ADD]   id={row.id}  name='{row.location}'  maps={row.maps_link}")
+        for entry in LOCATIONS_TO_SEED:
+            if entry["location"] not in inserted_names:
+                print(f"  [SKIP]  '{entry['location']}' already exists")
+
+        print(f"\nDone! Added: {len(inserted)}, Skipped: {len(LOCATIONS_TO_SEED) - len(inserted)}")
 
     except Exception as e:
         db.rollback()
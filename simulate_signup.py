@@ -1,17 +1,29 @@
-import requests
+import sys
+import time
 
-url = "http://localhost:8000/auth/api/signup"
-data = {
-    "username": "testuser_" + str(int(__import__('time').time())),
-    "email": "test" + str(int(__import__('time').time())) + "@example.com",
-    "password": "testpassword123",
-    "firstname": "Test",
-    "lastname": "User"
-}
+from tests._http import SESSION, BASE
 
-try:
-    response = requests.post(url, data=data)
-    print(f"Status Code: {response.status_code}")
-    print(f"Response Body: {response.text}")
-except Exception as e:
-    print(f"Error: {e}")
+url = f"{BASE}/auth/api/signup"
+
+# Optional user count for load simulation: python simulate_signup.py 50
+num_users = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+# One clock read; later users get an index suffix to stay unique
+ts = str(int(time.time()))
+
+for i in range(num_users):
+    suffix = ts if num_users == 1 else f"{ts}_{i}"
+    data = {
+        "username": f"testuser_{suffix}",
+        "email": f"test{suffix}@example.com",
+        "password": "testpassword123",
+        "firstname": "Test",
+        "lastname": "User"
+    }
+
+    try:
+        response = SESSION.post(url, data=data)
+        print(f"Status Code: {response.status_code}")
+        print(f"Response Body: {response.text}")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -1,13 +1,20 @@
-import requests
-import json
+import orjson
+
+from tests._http import SESSION, BASE
 
 try:
-    response = requests.get("http://localhost:8000/api/cars")
+    # Stream the body and parse the raw bytes directly: no .content copy, no decode step
+    response = SESSION.get(f"{BASE}/api/cars", stream=True)
     print(f"Status Code: {response.status_code}")
-    print(f"Response Body: {response.content.decode()}")
     try:
-        print(f"Formatted JSON: {json.dumps(response.json(), indent=2)}")
-    except:
-        pass
+        parsed = orjson.loads(response.raw.read(decode_content=True))
+        if isinstance(parsed, list):
+            print(f"Cars returned: {len(parsed)}")
+            parsed = parsed[:3]
+        print(f"Sample: {orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode()}")
+    except orjson.JSONDecodeError:
+        print("Response body is not valid JSON")
+    finally:
+        response.close()
 except Exception as e:
     print(f"Error: {e}")
@@ -0,0 +1,68 @@
+"""
+Test script for POST /payments/calculate-price with a coupon
+
+Usage:
+    python test_calculate_price.py [COUPON_CODE]
+
+Steps it performs:
+    1. Login to get the access_token cookie
+    2. Price a booking without a coupon
+    3. Price the same booking with the coupon
+    4. Verify both succeed and the coupon request returns coupon fields
+"""
+
+import sys
+
+from tests._http import SESSION, BASE
+
+CAR_ID = 1          # ← change to an existing car
+HOURS = 24
+COUPON_CODE = sys.argv[1] if len(sys.argv) > 1 else "WELCOME10"   # ← change to an active coupon
+
+# ── Step 1: Login ──────────────────────────────────────────────────────────────
+print("Step 1: Logging in...")
+login_resp = SESSION.post(f"{BASE}/auth/api/login", data={
+    "username": "testuser",   # ← change to a valid user
+    "password": "test1234",   # ← change to match
+})
+print(f"  Status : {login_resp.status_code}")
+
+if login_resp.status_code != 200:
+    print(f"  Error  : {login_resp.text}")
+    print("\nCannot continue without a valid login. Check username/password.")
+    exit(1)
+
+# The cookie is marked secure outside DEBUG, so send it explicitly over plain http
+cookies = {"access_token": login_resp.cookies["access_token"]}
+
+PRICE_URL = f"{BASE}/payments/calculate-price"
+
+
+def price(coupon_code=None) -> dict:
+    """POST one pricing request and return the parsed body"""
+    body = {"car_id": CAR_ID, "hours": HOURS, "damage_protection": 277}
+    if coupon_code:
+        body["coupon_code"] = coupon_code
+    resp = SESSION.post(PRICE_URL, json=body, cookies=cookies)
+    print(f"  Status : {resp.status_code}")
+    print(f"  Body   : {resp.text[:300]}")
+    assert resp.status_code == 200, f"Expected 200, got {resp.status_code}"
+    return resp.json()
+
+
+# ── Step 2: Without coupon ─────────────────────────────────────────────────────
+print("\nStep 2: Pricing without a coupon...")
+plain = price()
+assert plain["coupon_applied"] is False
+
+# ── Step 3: With coupon ────────────────────────────────────────────────────────
+print(f"\nStep 3: Pricing with coupon {COUPON_CODE}...")
+with_coupon = price(COUPON_CODE)
+assert "coupon_applied" in with_coupon and "coupon_id" in with_coupon
+
+if with_coupon["coupon_applied"]:
+    print(f"\n  Coupon applied (id {with_coupon['coupon_id']}).")
+else:
+    print("\n  Coupon was not valid for this booking; request still priced correctly.")
+
+print("\nAll assertions passed.")
@@ -1,45 +1,55 @@
-import requests
-import json
+import asyncio
+import httpx
 from datetime import datetime, timedelta
+from functools import lru_cache
 
-BASE_URL = "http://localhost:8000/api/cars"
+from tests._http import BASE
 
-def test_get_all():
-    print("\nTesting GET /api/cars (all)")
-    r = requests.get(BASE_URL)
-    print(f"Status: {r.status_code}")
-    if r.status_code == 200:
-        print(f"Count: {len(r.json())}")
+CARS_PATH = "/api/cars"
 
-def test_get_location_id(loc_id):
-    print(f"\nTesting GET /api/cars?location_id={loc_id}")
-    r = requests.get(f"{BASE_URL}?location_id={loc_id}")
-    print(f"Status: {r.status_code}")
-    if r.status_code == 200:
-        print(f"Count: {len(r.json())}")
-        for car in r.json():
-            print(f" - {car['brand']} {car['model']} (Location ID: {loc_id})")
-
-def test_get_availability():
-    pickup = (datetime.now() + timedelta(days=1)).isoformat()
-    ret = (datetime.now() + timedelta(days=2)).isoformat()
-    print(f"\nTesting GET /api/cars?pickup_date={pickup}&return_date={ret}")
-    r = requests.get(f"{BASE_URL}?pickup_date={pickup}&return_date={ret}")
-    print(f"Status: {r.status_code}")
-    if r.status_code == 200:
-        print(f"Count: {len(r.json())}")
+@lru_cache(maxsize=None)
+def availability_params(pickup_offset=1, return_offset=2):
+    """Build the pickup/return query params for the given day offsets once"""
+    now = datetime.now()
+    return (
+        ("pickup_date", (now + timedelta(days=pickup_offset)).isoformat()),
+        ("return_date", (now + timedelta(days=return_offset)).isoformat()),
+    )
 
-def test_backward_compat():
-    print("\nTesting GET /api/cars (backward compat - other filters)")
-    # Testing if seats still works (it should)
-    r = requests.get(f"{BASE_URL}?seats=5&min_price=1000")
+# Folded once at import time and reused by every run of main()
+_AVAIL_PARAMS = availability_params()
+_PICKUP = _AVAIL_PARAMS[0][1]
+_RETURN = _AVAIL_PARAMS[1][1]
+
+def report(title, r, show_cars_for=None):
+    """Print one check's result as a block"""
+    print(f"\n{title}")
     print(f"Status: {r.status_code}")
     if r.status_code == 200:
-        print(f"Count: {len(r.json())}")
+        cars = r.json()
+        print(f"Count: {len(cars)}")
+        if show_cars_for is not None:
+            for car in cars:
+                print(f" - {car['brand']} {car['model']} (Location ID: {show_cars_for})")
 
-if __name__ == "__main__":
-    test_get_all()
+async def main():
     # Note: These values depend on existing DB content
-    test_get_location_id(1) 
-    test_get_availability()
-    test_backward_compat()
+    loc_id = 1
+
+    # All checks are independent: issue them together on one client and connection pool
+    async with httpx.AsyncClient(base_url=BASE, http2=True) as client:
+        all_cars, by_location, availability, backward_compat = await asyncio.gather(
+            client.get(CARS_PATH),
+            client.get(CARS_PATH, params={"location_id": loc_id}),
+            client.get(CARS_PATH, params=_AVAIL_PARAMS),
+            # Testing if seats still works (it should)
+            client.get(CARS_PATH, params={"seats": 5, "min_price": 1000}),
+        )
+
+    report("Testing GET /api/cars (all)", all_cars)
+    report(f"Testing GET /api/cars?location_id={loc_id}", by_location, show_cars_for=loc_id)
+    report(f"Testing GET /api/cars?pickup_date={_PICKUP}&return_date={_RETURN}", availability)
+    report("Testing GET /api/cars (backward compat - other filters)", backward_compat)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,11 +1,30 @@
+import os
+import importlib.metadata
+from functools import lru_cache
 from passlib.context import CryptContext
-import bcrypt
 
-print(f"Bcrypt version: {getattr(bcrypt, '__version__', 'unknown')}")
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Read the installed version from package metadata instead of importing the C extension
+try:
+    bcrypt_version = importlib.metadata.version("bcrypt")
+except importlib.metadata.PackageNotFoundError:
+    bcrypt_version = "unknown"
+print(f"Bcrypt version: {bcrypt_version}")
+
+# BCRYPT_FAST=1 drops to the minimum cost (2^4 instead of 2^12 rounds) for quick smoke runs
+if os.getenv("BCRYPT_FAST") == "1":
+    pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4, deprecated="auto")
+else:
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+@lru_cache(maxsize=32)
+def hash_password(password):
+    """Hash once per password; repeat calls in the same process reuse the result"""
+    return pwd_context.hash(password)
+
 
 try:
-    h = pwd_context.hash("admin123")
+    h = hash_password("admin123")
     print(f"Hash: {h}")
 except Exception as e:
     print(f"Error: {e}")
@@ -11,13 +11,12 @@ Steps it performs:
     4. Verify response: {"message": "KYC uploaded successfully", "kyc_status": "PENDING"}
 """
 
-import io
-import requests
+from urllib3 import encode_multipart_formdata
 
-BASE_URL = "http://localhost:8000"
+from tests._http import SESSION, BASE
 
 # ── Step 1: Login ──────────────────────────────────────────────────────────────
-LOGIN_URL = f"{BASE_URL}/api/mobile/login"
+LOGIN_URL = f"{BASE}/api/mobile/login"
 
 login_payload = {
     "username": "testuser",   # ← change to a valid mobile user
@@ -25,7 +24,7 @@ login_payload = {
 }
 
 print("Step 1: Logging in...")
-login_resp = requests.post(LOGIN_URL, json=login_payload)
+login_resp = SESSION.post(LOGIN_URL, json=login_payload)
 print(f"  Status : {login_resp.status_code}")
 
 if login_resp.status_code != 200:
@@ -38,8 +37,8 @@ print(f"  Token  : {token[:40]}...")
 
 headers = {"Authorization": f"Bearer {token}"}
 
-# ── Step 2: Upload KYC documents ───────────────────────────────────────────────
-KYC_URL = f"{BASE_URL}/api/mobile/kyc/upload"
+# ── Multipart bodies for steps 2 + 3 ──────────────────────────────────────────
+KYC_URL = f"{BASE}/api/mobile/kyc/upload"
 
 # Create minimal in-memory PNG bytes (1x1 white pixel)
 DUMMY_PNG = (
@@ -49,15 +48,29 @@ DUMMY_PNG = (
     b'\xd8N\x00\x00\x00\x00IEND\xaeB`\x82'
 )
 
-files = {
-    "aadhaar_front":          ("aadhaar_front.png",  io.BytesIO(DUMMY_PNG), "image/png"),
-    "aadhaar_back":           ("aadhaar_back.png",   io.BytesIO(DUMMY_PNG), "image/png"),
-    "drivinglicense_front":   ("dl_front.png",       io.BytesIO(DUMMY_PNG), "image/png"),
-    "drivinglicense_back":    ("dl_back.png",        io.BytesIO(DUMMY_PNG), "image/png"),
-}
 
-print("\nStep 2: Uploading KYC documents (all 4)...")
-kyc_resp = requests.post(KYC_URL, headers=headers, files=files)
+def build_files(include_dl: bool = True) -> dict:
+    """Fresh multipart dict; every part shares the same immutable DUMMY_PNG bytes"""
+    files = {
+        "aadhaar_front": ("aadhaar_front.png", DUMMY_PNG, "image/png"),
+        "aadhaar_back":  ("aadhaar_back.png",  DUMMY_PNG, "image/png"),
+    }
+    if include_dl:
+        files["drivinglicense_front"] = ("dl_front.png", DUMMY_PNG, "image/png")
+        files["drivinglicense_back"] = ("dl_back.png", DUMMY_PNG, "image/png")
+    return files
+
+# Encode each multipart body once up front; the POSTs send the prebuilt bytes as-is
+FULL_BODY, FULL_CTYPE = encode_multipart_formdata(build_files())
+MINIMAL_BODY, MINIMAL_CTYPE = encode_multipart_formdata(build_files(include_dl=False))
+
+def upload(body: bytes, content_type: str):
+    """POST one prebuilt multipart body on the shared session"""
+    return SESSION.post(KYC_URL, data=body, headers={**headers, "Content-Type": content_type})
+
+# ── Step 2: Upload KYC documents (all 4) ─────────────────────────────────────
+print("\nStep 2: Uploading all 4 documents...")
+kyc_resp = upload(FULL_BODY, FULL_CTYPE)
 print(f"  Status  : {kyc_resp.status_code}")
 print(f"  Response: {kyc_resp.json()}")
 
@@ -69,14 +82,9 @@ assert body.get("kyc_status") == "PENDING", "kyc_status should be PENDING"
 print("\n✅ All assertions passed. Endpoint is working correctly.")
 
 # ── Step 3: Upload aadhaar only (optional docs omitted) ───────────────────────
-print("\nStep 3: Uploading KYC with mandatory docs only (no DL)...")
-
-files_minimal = {
-    "aadhaar_front": ("aadhaar_front.png", io.BytesIO(DUMMY_PNG), "image/png"),
-    "aadhaar_back":  ("aadhaar_back.png",  io.BytesIO(DUMMY_PNG), "image/png"),
-}
-
-kyc_resp2 = requests.post(KYC_URL, headers=headers, files=files_minimal)
+# Runs after step 2 completes: both steps update the same user's KYC status
+print("\nStep 3: Uploading mandatory docs only (no DL)...")
+kyc_resp2 = upload(MINIMAL_BODY, MINIMAL_CTYPE)
 print(f"  Status  : {kyc_resp2.status_code}")
 print(f"  Response: {kyc_resp2.json()}")
 
@@ -0,0 +1,17 @@
+"""
+Shared HTTP setup for the manual test scripts in the project root.
+
+Scripts import SESSION and BASE from here instead of each building
+their own session and base URL:
+
+    from tests._http import SESSION, BASE
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE = "http://localhost:8000"
+
+# One keep-alive connection pool shared by every script in the process
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
@@ -2,18 +2,22 @@ import sqlite3
 
 def update_locations():
     conn = sqlite3.connect('gogocar.db')
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
     cursor = conn.cursor()
     try:
-        # Update Chilkalurupet -> Chilakalurupet
-        cursor.execute("UPDATE locations SET location = 'Chilakalurupet' WHERE location = 'Chilkalurupet'")
-        
-        # Insert Guntur if it doesn't exist
-        cursor.execute("SELECT * FROM locations WHERE location = 'Guntur'")
-        if not cursor.fetchone():
-            cursor.execute("INSERT INTO locations (location) VALUES ('Guntur')")
-            print("Added Guntur to locations.")
-            
-        conn.commit()
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS ux_locations_location ON locations(location)')
+        # One transaction, one parse per statement: rename first so the insert below can't collide with it
+        with conn:
+            cursor.execute(
+                "UPDATE locations SET location = ? WHERE location = ?",
+                ('Chilakalurupet', 'Chilkalurupet'),
+            )
+            cursor.executemany(
+                "INSERT INTO locations (location) VALUES (?) ON CONFLICT(location) DO NOTHING",
+                [('Chilakalurupet',), ('Guntur',)],
+            )
         print("Locations updated successfully.")
     except Exception as e:
         print(f"Error: {e}")